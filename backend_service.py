@@ -9,38 +9,179 @@ Usage:
 
 import os
 import sys
+import queue
+import atexit
 import signal
 import logging
+import threading
+import logging.handlers
 import argparse
+import importlib.util
 from pathlib import Path
+from typing import Optional
 
-# Setup logging first
+# Log locations; the directory and handlers are created by configure_logging()
 LOG_DIR = Path(os.getenv('APPDATA', Path.home())) / 'license-wrapper' / 'logs'
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = LOG_DIR / 'backend.log'
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that coalesces writes in a large buffer.
+
+    The per-record flush() is skipped; a background thread flushes the
+    buffer every ``flush_interval`` seconds and close() fsyncs it.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None,
+                 buffer_size: int = 65536, flush_interval: float = 0.5):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name='log-flusher', daemon=True
+        )
+        self._flusher.start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self.buffer_size, encoding=self.encoding)
+
+    def flush(self):
+        """No-op: the flusher thread drains the buffer periodically."""
+
+    def _flush_loop(self):
+        while not self._flush_stop.wait(self.flush_interval):
+            self.force_flush()
+
+    def force_flush(self, fsync: bool = False):
+        """Write buffered records to disk now."""
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+                if fsync:
+                    os.fsync(self.stream.fileno())
+        finally:
+            self.release()
+
+    def close(self):
+        self._flush_stop.set()
+        self.force_flush(fsync=True)
+        super().close()
+
+
+class PreformatFilter(logging.Filter):
+    """Merge ``msg % args`` once in the emitting thread.
+
+    The listener-side formatter then only adds the timestamp and level around
+    an already materialised message.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = record.getMessage()
+        record.args = None
+        return True
+
+
+class PreformattedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the record as-is.
+
+    PreformatFilter has already merged the message, so the stock prepare()
+    (a Formatter pass plus a copy of every record) is skipped.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+log_listener = None
+_file_handler = None
+
+
+def configure_logging():
+    """Create the log directory and start the queue-backed log handlers.
+
+    The root logger only enqueues records; a listener thread owns the real
+    handlers so formatting and disk I/O never block the event loop. Called
+    from main() so --help and plain imports skip the filesystem work.
+    """
+    global log_listener, _file_handler
+    if log_listener is not None:
+        return
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    log_queue = queue.SimpleQueue()
+    log_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+
+    _file_handler = BufferedFileHandler(LOG_FILE, encoding='utf-8')
+    _file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+
+    queue_handler = PreformattedQueueHandler(log_queue)
+    queue_handler.addFilter(PreformatFilter())
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    log_listener = logging.handlers.QueueListener(
+        log_queue, _file_handler, stream_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(stop_log_listener)
+
+    # Route uvicorn's loggers through the same queue instead of their own handlers
+    for name in ('uvicorn', 'uvicorn.access', 'uvicorn.error'):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+
+def stop_log_listener():
+    """Drain queued log records and stop the listener thread (idempotent)."""
+    if log_listener is not None and log_listener._thread is not None:
+        log_listener.stop()
+
+
+def flush_log_file(fsync: bool = False):
+    """Write any buffered log records to disk."""
+    if _file_handler is not None:
+        _file_handler.force_flush(fsync=fsync)
+
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_PORT = 8765
+
 # Add server directory to path
-SERVER_DIR = Path(__file__).parent / 'server'
-if str(SERVER_DIR) not in sys.path:
-    sys.path.insert(0, str(SERVER_DIR))
+SERVER_DIR = Path(__file__).resolve().parent / 'server'
+_SERVER_DIR_STR = str(SERVER_DIR)
+# Flag on sys (not a module global) so re-imports under test runners or
+# reloaders stay idempotent without scanning sys.path
+if not getattr(sys, '_lw_server_dir_added', False):
+    sys.path.insert(0, _SERVER_DIR_STR)
+    sys._lw_server_dir_added = True
+
+def find_free_port(start_port: Optional[int] = None, max_attempts: int = 6) -> int:
+    """Find a free port.
 
-def find_free_port(start_port: int = 8765, max_attempts: int = 6) -> int:
-    """Find a free port starting from start_port."""
+    Without a preferred start_port the kernel assigns an ephemeral port in a
+    single bind(); otherwise probe start_port..start_port + max_attempts.
+    """
     import socket
-    
+
+    if start_port is None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(('127.0.0.1', 0))
+            return s.getsockname()[1]
+
     for port in range(start_port, start_port + max_attempts):
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                # Windows otherwise lets a second socket bind a port in use
+                if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
                 s.bind(('127.0.0.1', port))
                 return port
         except OSError:
@@ -49,64 +190,130 @@ def find_free_port(start_port: int = 8765, max_attempts: int = 6) -> int:
     raise RuntimeError(f"No free ports found in range {start_port}-{start_port + max_attempts}")
 
 
+_server = None
+
+
 def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
+    """Handle shutdown signals gracefully.
+
+    Once uvicorn is serving, ask it to drain connections and return from
+    run() so the finally blocks can flush logs; before that, just exit.
+    """
     logger.info("Received shutdown signal, stopping backend...")
+    if _server is not None:
+        _server.should_exit = True
+        return
+    stop_log_listener()
+    flush_log_file(fsync=True)
     sys.exit(0)
 
 
-def run_backend(port: int):
-    """Run the backend server."""
+_app = None
+
+
+def load_app():
+    """Import the FastAPI app from server/main.py once and reuse it."""
+    global _app
+    if _app is None:
+        # Relative paths in the server assume it runs from its own directory
+        if os.getcwd() != _SERVER_DIR_STR:
+            os.chdir(SERVER_DIR)
+        spec = importlib.util.spec_from_file_location(
+            'lw_server_main', SERVER_DIR / 'main.py'
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['lw_server_main'] = module
+        spec.loader.exec_module(module)
+        _app = module.app
+    return _app
+
+
+def _fast_server_impl() -> dict:
+    """Pick uvloop + httptools when installed (uvicorn[standard]), else auto."""
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+    except ImportError:
+        return {'loop': 'auto', 'http': 'auto'}
+    return {'loop': 'uvloop', 'http': 'httptools'}
+
+
+def run_backend(port: int, verbose: bool = False, access_log: bool = False):
+    """Run the backend server.
+
+    uvicorn runs at WARNING level with the access log disabled unless
+    ``verbose`` / ``access_log`` are set, since per-request logging costs
+    noticeable throughput.
+    """
+    global _server
     import uvicorn
     
-    # Change to server directory for proper imports
-    os.chdir(SERVER_DIR)
-    
     logger.info(f"Starting backend on port {port}...")
     logger.info(f"Log file: {LOG_FILE}")
     
-    # Write port file for Tauri to read
+    # Write port file for Tauri to read ("pid:port"); publish atomically so a
+    # reader never sees a partially written file
     port_file = LOG_DIR / 'backend.port'
-    port_file.write_text(str(port))
+    tmp_port_file = port_file.with_suffix('.port.tmp')
+    tmp_port_file.write_text(f"{os.getpid()}:{port}\n")
+    os.replace(tmp_port_file, port_file)
     logger.info(f"Port file written: {port_file}")
     
     try:
-        # Import app from server/main.py
-        from main import app
+        app = load_app()
         
         # Run without auto-reload in production
-        uvicorn.run(
+        config = uvicorn.Config(
             app,
             host='127.0.0.1',
             port=port,
-            log_level='info',
-            access_log=True,
+            log_level='info' if verbose else 'warning',
+            access_log=access_log,
+            # Keep uvicorn on our queue-backed root handlers
+            log_config=None,
             # No reload in production
             reload=False,
+            **_fast_server_impl(),
         )
+        _server = uvicorn.Server(config)
+        _server.run()
     except Exception as e:
         logger.error(f"Failed to start backend: {e}")
         raise
     finally:
-        # Cleanup port file on exit
-        if port_file.exists():
-            port_file.unlink()
+        _server = None
+        flush_log_file()
+        # Cleanup port file on exit, unless a newer backend has replaced it
+        try:
+            owner_pid = port_file.read_text().split(':', 1)[0].strip()
+            if owner_pid == str(os.getpid()):
+                port_file.unlink()
+        except OSError:
+            pass
 
 
 def main():
     parser = argparse.ArgumentParser(description='License Wrapper Backend Service')
-    parser.add_argument('--port', type=int, default=8765, help='Port to run on (default: 8765)')
-    parser.add_argument('--auto-port', action='store_true', help='Auto-find free port if default busy')
+    parser.add_argument('--port', type=int, default=None,
+                        help=f'Port to run on (default: {DEFAULT_PORT})')
+    parser.add_argument('--auto-port', action='store_true',
+                        help='Auto-find a free port (OS-assigned unless --port is given)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log uvicorn at INFO level (slower; for debugging)')
+    parser.add_argument('--access-log', action='store_true',
+                        help='Log every HTTP request (expensive; for debugging)')
     args = parser.parse_args()
+    configure_logging()
     
     # Setup signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        port = args.port
         if args.auto_port:
             port = find_free_port(args.port)
+        else:
+            port = args.port if args.port is not None else DEFAULT_PORT
         
         logger.info("=" * 50)
         logger.info("License Wrapper Backend Service")
@@ -114,11 +321,15 @@ def main():
         logger.info(f"PID: {os.getpid()}")
         logger.info("=" * 50)
         
-        run_backend(port)
+        run_backend(port, verbose=args.verbose, access_log=args.access_log)
         
     except Exception as e:
         logger.error(f"Backend service failed: {e}")
         sys.exit(1)
+    finally:
+        # Drain the log queue before the interpreter starts tearing down
+        stop_log_listener()
+        flush_log_file(fsync=True)
 
 
 if __name__ == '__main__':
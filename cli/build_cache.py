@@ -0,0 +1,249 @@
+"""
+Persistent build workspaces for License Wrapper CLI.
+Keeps extracted sources, node_modules and Nuitka build state between builds
+of the same project so rebuilds only redo the parts that changed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+
+
+CACHE_DIR = Path.home() / ".lw-compiler" / "cache"
+META_FILE = ".build_meta.json"
+BUNDLE_FILE = "bundle.zip"
+# project_id -> {"etag", "workspace"} for the last bundle downloaded per project
+BUNDLE_INDEX = CACHE_DIR / "bundles.json"
+MAX_WORKSPACES = 5
+
+# Node base binaries downloaded by pkg (passed to it as PKG_CACHE_PATH); shared
+# by every project and kept across `cache clear`
+PKG_CACHE_DIR = Path.home() / ".lw-compiler" / "pkg-cache"
+
+# ccache object store for Nuitka's C compilation (CCACHE_DIR), also shared
+CCACHE_DIR = Path.home() / ".lw-compiler" / "ccache"
+
+# Bundle members that differ per build request rather than per source tree
+_VOLATILE_MEMBERS = {"config.json"}
+
+# Config keys that change what the compiler produces
+_CONFIG_HASH_KEYS = (
+    "entry_file",
+    "output_name",
+    "language",
+    "nuitka_options",
+    "compiler_options",
+)
+
+
+def source_hash(zf: zipfile.ZipFile) -> str:
+    """Fingerprint a bundle's sources from its central directory.
+
+    Uses member names, CRC-32s and sizes, so nothing is decompressed.
+    config.json is skipped because it embeds the license key.
+    """
+    h = hashlib.sha256()
+    for info in sorted(zf.infolist(), key=lambda i: i.filename):
+        if info.filename in _VOLATILE_MEMBERS:
+            continue
+        h.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\n".encode())
+    return h.hexdigest()
+
+
+def config_hash(config: dict) -> str:
+    """Hash the parts of the compile config that affect build output."""
+    relevant = {k: config.get(k) for k in _CONFIG_HASH_KEYS}
+    return hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def workspace_for(src_hash: str) -> Path:
+    """Get the workspace directory for a source fingerprint."""
+    return CACHE_DIR / src_hash[:16]
+
+
+def _lock_file(workspace: Path) -> Path:
+    # Next to the workspace, not in it, so wiping the workspace keeps it
+    return workspace.with_name(workspace.name + ".lock")
+
+
+def try_lock(workspace: Path):
+    """Take a workspace's exclusive build lock without waiting.
+
+    Returns the open lock file to pass to release(), or None when another
+    build holds the lock. The OS drops the lock if the process dies.
+    """
+    workspace.parent.mkdir(parents=True, exist_ok=True)
+    path = _lock_file(workspace)
+    while True:
+        lock = open(path, "a+b")
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return None
+        # prune() deletes a lock file once its workspace is gone; a lock
+        # taken on the deleted file guards nothing, so retry on the new one
+        try:
+            if os.path.samestat(os.fstat(lock.fileno()), os.stat(path)):
+                return lock
+        except OSError:
+            pass
+        release(lock)
+
+
+def release(lock):
+    """Release a lock taken with try_lock() (None is ignored)."""
+    if lock is None:
+        return
+    if sys.platform == "win32":
+        import msvcrt
+
+        lock.seek(0)
+        try:
+            msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+    lock.close()  # Also releases a POSIX flock
+
+
+def read_meta(workspace: Path) -> dict:
+    """Load a workspace's build metadata ({} if missing or unreadable)."""
+    try:
+        return json.loads((workspace / META_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_meta(workspace: Path, meta: dict):
+    """Save a workspace's build metadata."""
+    (workspace / META_FILE).write_text(json.dumps(meta, indent=2))
+
+
+def cached_bundle(project_id: str):
+    """Get (etag, bundle_path) of a project's last downloaded bundle, or None."""
+    try:
+        entry = json.loads(BUNDLE_INDEX.read_text()).get(project_id) or {}
+    except (OSError, ValueError):
+        return None
+    bundle_path = CACHE_DIR / entry.get("workspace", "") / BUNDLE_FILE
+    if entry.get("etag") and entry.get("workspace") and bundle_path.is_file():
+        return entry["etag"], bundle_path
+    return None
+
+
+def _replace_with(target: Path, write):
+    """Have write(tmp_path) fill a sibling temp file, then rename it to target.
+
+    Another build reading the cache concurrently sees the old file or the
+    new one, never a partial write.
+    """
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def remember_bundle(project_id: str, etag: str, workspace: Path, bundle):
+    """Keep a downloaded bundle (bytes or path) in its workspace under its ETag."""
+    target = workspace / BUNDLE_FILE
+    if isinstance(bundle, bytes):
+        _replace_with(target, lambda tmp: tmp.write_bytes(bundle))
+    elif Path(bundle) != target:
+        _replace_with(target, lambda tmp: shutil.copyfile(bundle, tmp))
+    try:
+        index = json.loads(BUNDLE_INDEX.read_text())
+    except (OSError, ValueError):
+        index = {}
+    index[project_id] = {"etag": etag, "workspace": workspace.name}
+    text = json.dumps(index, indent=2)
+    _replace_with(BUNDLE_INDEX, lambda tmp: tmp.write_text(text))
+
+
+def _remove_workspace(workspace: Path) -> bool:
+    """Delete a workspace unless a running build has it locked.
+
+    Returns False, leaving it in place, when the workspace is in use.
+    """
+    lock = try_lock(workspace)
+    if lock is None:
+        return False
+    try:
+        shutil.rmtree(workspace, ignore_errors=True)
+        try:
+            _lock_file(workspace).unlink()
+        except OSError:  # Still open elsewhere (Windows)
+            pass
+    finally:
+        release(lock)
+    return True
+
+
+def prune(keep: int = MAX_WORKSPACES):
+    """Delete all but the ``keep`` most recently used workspaces.
+
+    Workspaces a running build has locked are left alone.
+    """
+    if not CACHE_DIR.exists():
+        return
+
+    def last_used(path: Path) -> float:
+        try:
+            return (path / META_FILE).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    workspaces = sorted(
+        (p for p in CACHE_DIR.iterdir() if p.is_dir()), key=last_used, reverse=True
+    )
+    for stale in workspaces[keep:]:
+        _remove_workspace(stale)
+
+
+def cache_size() -> int:
+    """Total size of the build cache in bytes."""
+    total = 0
+    for root, _dirs, files in os.walk(CACHE_DIR):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def clear():
+    """Remove every cached workspace a running build isn't using.
+
+    Returns (bytes freed, names of the workspaces left in place because
+    they are in use).
+    """
+    if not CACHE_DIR.exists():
+        return 0, []
+    before = cache_size()
+    in_use = []
+    for path in list(CACHE_DIR.iterdir()):
+        if path.is_dir():
+            if not _remove_workspace(path):
+                in_use.append(path.name)
+        elif path.suffix != ".lock":  # Lock files go with their workspace
+            path.unlink(missing_ok=True)
+    if not in_use:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return before - cache_size(), in_use
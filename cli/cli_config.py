@@ -3,52 +3,191 @@ Configuration management for License Wrapper CLI.
 Handles loading/saving config and API settings.
 """
 
+from __future__ import annotations
+
 import os
-import json
+import time
+import base64
 from pathlib import Path
 
+# (loads, dumps) from orjson when installed, else the json module; resolved
+# on first use so commands that never touch JSON skip importing either
+_CODEC = None
+
+
+def _codec():
+    global _CODEC
+    if _CODEC is None:
+        try:
+            import orjson
+
+            def dumps(obj) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+            _CODEC = (orjson.loads, dumps)
+        except ImportError:
+            import json
+
+            def dumps(obj) -> bytes:
+                return json.dumps(obj, indent=2).encode("utf-8")
+
+            _CODEC = (json.loads, dumps)
+    return _CODEC
+
+
+def _loads(data):
+    return _codec()[0](data)
+
+
+def _dumps(obj) -> bytes:
+    return _codec()[1](obj)
+
+
+def parse_json(data):
+    """Decode a JSON document from bytes or str (orjson when installed)."""
+    return _loads(data)
+
 
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_FILE = SCRIPT_DIR / "config.json"
 DEFAULT_API_BASE = "http://localhost:8000/api/v1"
 
+# Parsed config keyed by the file's (mtime_ns, size) so repeated lookups
+# within one command only cost an os.stat().
+# The auth headers and token expiry derived from it are cached next to the
+# data as "auth" and dropped whenever the data changes.
+_CACHE = {"mtime_ns": None, "size": None, "data": {}, "auth": None}
+
+# Treat tokens this close to expiry as already expired
+TOKEN_EXPIRY_LEEWAY = 30
+
+
+def invalidate_config_cache():
+    """Force the next load_config() to re-read the file."""
+    _CACHE.update(mtime_ns=None, size=None, data={}, auth=None)
+
+
+def _cached_config() -> dict:
+    """Return the cached config, re-reading the file only if it changed."""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        invalidate_config_cache()
+        return _CACHE["data"]
+    except OSError:
+        return {}
+
+    if st.st_mtime_ns != _CACHE["mtime_ns"] or st.st_size != _CACHE["size"]:
+        try:
+            data = _loads(CONFIG_FILE.read_bytes())
+        except (ValueError, OSError):
+            data = {}
+        _CACHE.update(mtime_ns=st.st_mtime_ns, size=st.st_size, data=data, auth=None)
+    return _CACHE["data"]
+
 
 def load_config() -> dict:
     """Load saved configuration."""
-    if CONFIG_FILE.exists():
-        try:
-            return json.loads(CONFIG_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
-            return {}
-    return {}
+    # Shallow copy so callers can edit it before save_config() without
+    # mutating the cached value.
+    return dict(_cached_config())
 
 
 def save_config(config: dict):
-    """Save configuration to file."""
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    """Save configuration to file.
+
+    Written to a private (0600) temp file and renamed into place, so the
+    token is never readable by other users nor left half-written.
+    """
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_FILE.parent, prefix=".config-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(config))
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, CONFIG_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Write-through: the next load_config() is served from memory
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        invalidate_config_cache()
+        return
+    _CACHE.update(
+        mtime_ns=st.st_mtime_ns, size=st.st_size, data=dict(config), auth=None
+    )
 
 
 def get_api_base() -> str:
     """Get API base URL from config or environment."""
-    config = load_config()
-    return config.get("api_url", os.getenv("LW_API_URL", DEFAULT_API_BASE))
+    # Read-only lookup, so the cached dict is used without copying it
+    api_url = _cached_config().get("api_url")
+    return api_url or os.getenv("LW_API_URL", DEFAULT_API_BASE)
+
+
+def _token_exp(token: str) -> float | None:
+    """Read a JWT's ``exp`` claim without verifying it (None if unavailable)."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        exp = _loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (ValueError, AttributeError):
+        return None
+    return exp if isinstance(exp, (int, float)) else None
+
+
+def token_expired(token: str) -> bool:
+    """Check locally whether a JWT has expired, saving a doomed request.
+
+    Tokens that are not JWTs, or carry no readable ``exp``, count as valid.
+    """
+    exp = _token_exp(token)
+    return exp is not None and exp <= time.time() + TOKEN_EXPIRY_LEEWAY
+
+
+def get_auth() -> tuple[bool, dict | None]:
+    """Get (logged_in, headers) from a single config read.
+
+    An expired token counts as logged out.
+    """
+    api_key = _cached_config().get("api_key")
+    if not api_key:
+        return False, None
+    if _CACHE["auth"] is None:
+        _CACHE["auth"] = ({"Authorization": f"Bearer {api_key}"}, _token_exp(api_key))
+    headers, exp = _CACHE["auth"]
+    if exp is not None and exp <= time.time() + TOKEN_EXPIRY_LEEWAY:
+        return False, None
+    return True, dict(headers)
 
 
 def get_headers() -> dict:
     """Get request headers with API key."""
-    config = load_config()
-    api_key = config.get("api_key")
-    if not api_key:
-        return None
-    return {"Authorization": f"Bearer {api_key}"}
+    return get_auth()[1]
 
 
 def is_logged_in() -> bool:
     """Check if user is logged in."""
-    return get_headers() is not None
+    return get_auth()[0]
+
+
+def forget_token():
+    """Drop a token the server rejected, keeping the email and API URL."""
+    config = load_config()
+    if config.pop("api_key", None) is not None:
+        save_config(config)
 
 
 def clear_config():
     """Clear saved configuration (logout)."""
     if CONFIG_FILE.exists():
         CONFIG_FILE.unlink()
+    invalidate_config_cache()
@@ -0,0 +1,114 @@
+"""
+Cached toolchain detection for License Wrapper CLI.
+Remembers probe results in ~/.lw-compiler/env.json so `status` does not have
+to start another interpreter just to read a version string.
+"""
+
+import json
+import os
+import site
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+ENV_CACHE_FILE = Path.home() / ".lw-compiler" / "env.json"
+
+# status runs the probes in parallel; each updates the shared file
+_LOCK = threading.Lock()
+
+
+def _python_fingerprint() -> str:
+    """Identify the current interpreter and the state of its site-packages.
+
+    Installing or removing a package changes the mtime of the site-packages
+    directory, which invalidates cached results.
+    """
+    dirs = list(getattr(site, "getsitepackages", lambda: [])())
+    dirs.append(site.getusersitepackages())
+    parts = [sys.executable]
+    for d in dirs:
+        try:
+            parts.append(f"{d}:{os.stat(d).st_mtime_ns}")
+        except OSError:
+            pass
+    return "|".join(parts)
+
+
+def _load() -> dict:
+    try:
+        return json.loads(ENV_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(key: str, entry: dict):
+    """Merge one probe result into the cache file."""
+    with _LOCK:
+        cache = _load()
+        cache[key] = entry
+        try:
+            ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            ENV_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        except OSError:
+            pass  # Cache is best-effort
+
+
+def get_nuitka_version() -> Optional[str]:
+    """Get the installed Nuitka version, or None if it is not installed."""
+    key = _python_fingerprint()
+    entry = _load().get("nuitka")
+    if entry and entry.get("key") == key:
+        return entry.get("version")
+
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        nuitka_version = version("Nuitka")
+    except PackageNotFoundError:
+        nuitka_version = None
+
+    _save("nuitka", {"key": key, "version": nuitka_version})
+    return nuitka_version
+
+
+def get_node_version() -> Optional[str]:
+    """Get the version of the node on PATH, or None if there is none.
+
+    The result is cached against the resolved executable's mtime and size,
+    so only an upgraded or switched node is asked again.
+    """
+    import shutil
+
+    node = shutil.which("node")
+    if node is None:
+        return None
+    try:
+        real = os.path.realpath(node)
+        st = os.stat(real)
+    except OSError:
+        return None
+    key = f"{real}:{st.st_mtime_ns}:{st.st_size}"
+    entry = _load().get("node")
+    if entry and entry.get("key") == key:
+        return entry.get("version")
+
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [node, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    node_version = result.stdout.decode("ascii", "replace").strip()
+
+    _save("node", {"key": key, "version": node_version})
+    return node_version
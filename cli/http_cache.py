@@ -0,0 +1,79 @@
+"""
+HTTP response cache for License Wrapper CLI.
+Keeps the last body and ETag of list endpoints in ~/.lw-compiler/http_cache.json
+so unchanged project/license lists come back as a bodiless 304.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+HTTP_CACHE_FILE = Path.home() / ".lw-compiler" / "http_cache.json"
+MAX_ENTRIES = 32
+
+# Prefetch threads may store responses at the same time
+_LOCK = threading.Lock()
+
+
+def _load() -> dict:
+    try:
+        return json.loads(HTTP_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def lookup(key: str) -> Optional[dict]:
+    """Get the cached {"etag", "body"} entry for a request key, if any."""
+    entry = _load().get(key)
+    if isinstance(entry, dict) and entry.get("etag") and "body" in entry:
+        return entry
+    return None
+
+
+def store(key: str, etag: str, body: str):
+    """Remember a response body and its ETag (best-effort)."""
+    with _LOCK:
+        cache = _load()
+        cache.pop(key, None)
+        cache[key] = {"etag": etag, "body": body}
+        # Dicts keep insertion order, so the oldest entries come first
+        for stale in list(cache)[:-MAX_ENTRIES]:
+            del cache[stale]
+        try:
+            _write_private(json.dumps(cache).encode("utf-8"))
+        except OSError:
+            pass
+
+
+def _write_private(data: bytes):
+    """Replace the cache file atomically with a 0600 file.
+
+    Cached bodies hold license keys and client details, and a crash
+    mid-write must not leave a truncated file behind.
+    """
+    import tempfile
+
+    HTTP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=HTTP_CACHE_FILE.parent, prefix=".http-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, HTTP_CACHE_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def clear():
+    """Drop every cached response."""
+    try:
+        HTTP_CACHE_FILE.unlink()
+    except OSError:
+        pass
@@ -11,24 +11,17 @@ Usage:
     lw-compiler build              - Interactive build mode
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import json
-import argparse
-import zipfile
-import subprocess
-import tempfile
-import shutil
-import time
+import codecs
+import re
 from pathlib import Path
-from getpass import getpass
 
-try:
-    import requests
-except ImportError:
-    print("❌ 'requests' module not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "-q"])
-    import requests
+# Heavier modules (requests, zipfile, subprocess, json, ...) and the build
+# helpers (build_cache, wrappers, env_cache) are imported inside the commands
+# that use them so `--help`, `logout` and `status` start quickly.
 
 # Import from extracted modules
 from terminal import Colors, color_print, print_header
@@ -36,32 +29,241 @@ from cli_config import (
     load_config,
     save_config,
     get_api_base,
-    get_headers,
+    get_auth,
+    parse_json,
+    token_expired,
+    forget_token,
     clear_config,
     DEFAULT_API_BASE,
 )
-from wrappers import get_python_wrapper, get_nodejs_wrapper_inline
+
+
+# Entry file extensions that mark a Node.js project
+_JS_EXTS = frozenset({".js", ".mjs", ".cjs", ".ts"})
+# Server-side settings a bundle's config.json overrides
+_BUNDLE_CONFIG_KEYS = ("license_key", "api_url", "server_url", "language")
+
+# Line templates for project/license listings (color codes joined once)
+_ITEM_TITLE = "  " + Colors.BOLD + "{}. {}" + Colors.RESET
+_ITEM_ID = "     ID: " + Colors.CYAN + "{}" + Colors.RESET
+_ITEM_STATUS = "     Status: {}{}" + Colors.RESET
+
+_SUCCESS_BANNER = "=" * 60 + "\n  ✅ BUILD SUCCESSFUL!\n" + "=" * 60
+
+# Shown when no command is given (Colors are fixed at import, so build it once)
+_WELCOME_BANNER = f"""
+{Colors.CYAN}╔════════════════════════════════════════════════════════════╗
+║  {Colors.BOLD}CodeVault CLI{Colors.CYAN} - Build license-protected executables    ║
+╚════════════════════════════════════════════════════════════╝{Colors.RESET}
+
+{Colors.GREEN}🚀 Quick Start:{Colors.RESET}
+  1. python lw_compiler.py login      {Colors.DIM}← Login first{Colors.RESET}
+  2. python lw_compiler.py build      {Colors.DIM}← Interactive build{Colors.RESET}
+
+{Colors.CYAN}📋 All Commands:{Colors.RESET}
+  login      Log in to your CodeVault account
+  logout     Log out and clear credentials
+  projects   List your projects
+  build      Build a project into an executable
+  status     Check login status and environment
+  cache      Show or clear the local build cache
+
+{Colors.YELLOW}💡 Tip:{Colors.RESET} Run 'python lw_compiler.py status' to check your setup.
+"""
+
+
+def _write_lines(lines, batch: int = 256):
+    """Write lines to stdout in blocks of `batch` lines, then flush once.
+
+    Accepts any iterable, so long listings can be generated row by row
+    without holding all of their text at once.
+    """
+    write = sys.stdout.write
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= batch:
+            write("\n".join(block) + "\n")
+            block.clear()
+    if block:
+        write("\n".join(block) + "\n")
+    sys.stdout.flush()
+
+
+def _project_lines(projects):
+    """Yield the listing lines for `projects`."""
+    for i, p in enumerate(projects, 1):
+        # The server sends the flag ready-made; older servers only had it
+        # inside the settings JSON
+        is_multi = p.get("is_multi_folder")
+        if is_multi is None:
+            settings = p.get("settings") or {}
+            if isinstance(settings, str):
+                settings = parse_json(settings)
+            is_multi = settings.get("is_multi_folder", False)
+        project_type = "📁 Multi-folder" if is_multi else "📄 Single file"
+
+        yield _ITEM_TITLE.format(i, p["name"])
+        yield _ITEM_ID.format(p["id"])
+        yield f"     Type: {project_type}"
+        yield ""
+
+
+def _license_lines(licenses):
+    """Yield the listing lines for `licenses`."""
+    for i, lic in enumerate(licenses, 1):
+        status_color = Colors.GREEN if lic["status"] == "active" else Colors.RED
+        yield _ITEM_TITLE.format(i, lic["license_key"])
+        yield _ITEM_STATUS.format(status_color, lic["status"])
+        if lic.get("client_name"):
+            yield f"     Client: {lic['client_name']}"
+        if lic.get("expires_at"):
+            yield f"     Expires: {lic['expires_at']}"
+        yield ""
+
+
+def _ensure_requests():
+    """Import requests on first use, installing it if missing."""
+    try:
+        import requests
+    except ImportError:
+        import subprocess
+
+        print("❌ 'requests' module not found. Installing...")
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "requests", "-q"]
+        )
+        import requests
+    return requests
+
+
+_SESSION = None
+
+# (connect, read) timeouts: an unreachable server fails fast, while a slow
+# but responsive one still gets the full read budget
+_API_TIMEOUT = (3.05, 10)
+_LOGIN_TIMEOUT = (5, 15)
+_BUNDLE_TIMEOUT = (5, 120)  # Longer read timeout for larger projects
+
+
+def _get_session():
+    """Get the shared requests.Session so API calls reuse pooled connections."""
+    global _SESSION
+    if _SESSION is None:
+        requests = _ensure_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                # Only idempotent methods are retried on these statuses (never
+                # the login POST); connect failures are retried for any method
+                status_forcelist=[502, 503, 504],
+                # Hand the last response to handle_error instead of raising
+                raise_on_status=False,
+            ),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Default headers shared by every request made through the session
+        logged_in, headers = get_auth()
+        if logged_in:
+            session.headers.update(headers)
+        _SESSION = session
+    return _SESSION
+
+
+def _close_response_future(future):
+    """Release the connection of a prefetched response that is not needed."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 
 def check_logged_in():
     """Check if user is logged in."""
-    headers = get_headers()
-    if not headers:
-        color_print("❌ Not logged in. Run 'lw-compiler login' first.", Colors.RED)
+    logged_in, headers = get_auth()
+    if not logged_in:
+        if load_config().get("api_key"):
+            color_print(
+                "❌ Session expired. Run 'lw-compiler login' again.", Colors.RED
+            )
+        else:
+            color_print("❌ Not logged in. Run 'lw-compiler login' first.", Colors.RED)
         sys.exit(1)
+    # Authenticate every subsequent request on the shared session
+    _get_session().headers.update(headers)
     return headers
 
 
+def _resp_json(resp):
+    """Decode a response body with the fastest available JSON parser."""
+    return parse_json(resp.content)
+
+
+def _get_cached_json(url: str, params: dict = None):
+    """GET a JSON endpoint, revalidating a disk-cached copy with its ETag.
+
+    Returns (resp, data). data is the decoded body for a 200, the cached
+    body for a 304, and None for any other status.
+    """
+    import http_cache
+    from urllib.parse import urlencode
+
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    cached = http_cache.lookup(key)
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+
+    resp = _get_session().get(url, params=params, headers=headers, timeout=_API_TIMEOUT)
+    if resp.status_code == 304 and cached:
+        return resp, parse_json(cached["body"])
+    if resp.status_code != 200:
+        return resp, None
+
+    data = _resp_json(resp)
+    etag = resp.headers.get("ETag")
+    if etag:
+        http_cache.store(key, etag, resp.content.decode("utf-8"))
+    return resp, data
+
+
+def _error_detail(resp) -> str:
+    """Extract the error message from an API error response.
+
+    JSON bodies are decoded once from the raw bytes; anything else is shown
+    as a short UTF-8 snippet, skipping requests' charset detection.
+    """
+    if resp.headers.get("content-type", "").startswith("application/json"):
+        try:
+            data = parse_json(resp.content)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and "detail" in data:
+            return str(data["detail"])
+        return "Unknown error"
+    return resp.content[:200].decode("utf-8", "replace").strip() or (
+        f"HTTP {resp.status_code}"
+    )
+
+
 def handle_error(resp):
     """Handle API error response."""
-    try:
-        error = resp.json().get("detail", "Unknown error")
-    except (json.JSONDecodeError, KeyError):
-        error = resp.text or f"HTTP {resp.status_code}"
+    error = _error_detail(resp)
 
     if resp.status_code == 401:
+        # The saved token is expired or revoked; stop sending it
+        import http_cache
+
+        forget_token()
+        http_cache.clear()
+        if _SESSION is not None:
+            _SESSION.headers.pop("Authorization", None)
         color_print(
-            "❌ Authentication failed. Run 'lw-compiler login' again.", Colors.RED
+            "❌ Session expired or revoked. Run 'lw-compiler login' again.", Colors.RED
         )
     elif resp.status_code == 404:
         color_print(f"❌ Not found: {error}", Colors.RED)
@@ -74,8 +276,21 @@ def handle_error(resp):
 # =============================================================================
 
 
+def _validate_email(email: str) -> str | None:
+    """Check an email address's shape; returns an error message or None."""
+    if not email:
+        return "Email is required."
+    local, _, domain = email.partition("@")
+    if not local or "." not in domain:
+        return "Please enter a valid email address."
+    return None
+
+
 def cmd_login(args):
     """Login with your CodeVault account."""
+    from getpass import getpass
+
+    requests = _ensure_requests()
     config = load_config()
 
     print_header("CodeVault CLI - Login")
@@ -88,18 +303,18 @@ def cmd_login(args):
 
     print("Enter your CodeVault account credentials:\n")
 
+    # Offer the last account so an expired session is one password away
+    last_email = config.get("email", "")
+    prompt = f"  Email [{last_email}]: " if last_email else "  Email: "
     try:
-        email = input("  Email: ").strip()
+        email = input(prompt).strip() or last_email
     except EOFError:
         color_print("\n❌ Input cancelled.", Colors.RED)
         return
 
-    # Validate email format
-    if not email:
-        color_print("\n❌ Email is required.", Colors.RED)
-        return
-    if "@" not in email or "." not in email:
-        color_print("\n❌ Please enter a valid email address.", Colors.RED)
+    error = _validate_email(email)
+    if error:
+        color_print(f"\n❌ {error}", Colors.RED)
         return
 
     try:
@@ -115,14 +330,14 @@ def cmd_login(args):
     print("\n⏳ Logging in...")
 
     try:
-        resp = requests.post(
+        resp = _get_session().post(
             f"{api_url}/auth/login",
             json={"email": email, "password": password},
-            timeout=15,
+            timeout=_LOGIN_TIMEOUT,
         )
 
         if resp.status_code == 200:
-            data = resp.json()
+            data = _resp_json(resp)
             token = data.get("access_token")
             user = data.get("user", {})
 
@@ -131,6 +346,7 @@ def cmd_login(args):
             config["email"] = email
             config["user_name"] = user.get("name", email)
             save_config(config)
+            _get_session().headers["Authorization"] = f"Bearer {token}"
 
             color_print(
                 f"\n✅ Logged in as {user.get('name', email)} ({email})", Colors.GREEN
@@ -146,11 +362,7 @@ def cmd_login(args):
                 "   Please check your credentials and try again.", Colors.YELLOW
             )
         else:
-            try:
-                error = resp.json().get("detail", "Unknown error")
-            except Exception:
-                error = resp.text or f"HTTP {resp.status_code}"
-            color_print(f"\n❌ Login failed: {error}", Colors.RED)
+            color_print(f"\n❌ Login failed: {_error_detail(resp)}", Colors.RED)
     except requests.exceptions.Timeout:
         color_print("\n❌ Connection timed out.", Colors.RED)
         color_print("   The server is taking too long to respond.", Colors.YELLOW)
@@ -168,20 +380,24 @@ def cmd_login(args):
 
 def cmd_logout(args):
     """Logout and clear saved credentials."""
+    import http_cache
+
     clear_config()
+    http_cache.clear()
+    if _SESSION is not None:
+        _SESSION.headers.pop("Authorization", None)
     color_print("✅ Logged out successfully.", Colors.GREEN)
 
 
 def cmd_projects(args):
     """List user's projects."""
-    headers = check_logged_in()
+    check_logged_in()
     api_url = get_api_base()
 
     try:
-        resp = requests.get(f"{api_url}/projects", headers=headers, timeout=10)
+        resp, projects = _get_cached_json(f"{api_url}/projects")
 
-        if resp.status_code == 200:
-            projects = resp.json()
+        if projects is not None:
             print_header("Your Projects")
 
             if not projects:
@@ -191,18 +407,7 @@ def cmd_projects(args):
                 )
                 return
 
-            for i, p in enumerate(projects, 1):
-                settings = p.get("settings", {})
-                if isinstance(settings, str):
-                    settings = json.loads(settings) if settings else {}
-
-                is_multi = settings.get("is_multi_folder", False)
-                project_type = "📁 Multi-folder" if is_multi else "📄 Single file"
-
-                print(f"  {Colors.BOLD}{i}. {p['name']}{Colors.RESET}")
-                print(f"     ID: {Colors.CYAN}{p['id']}{Colors.RESET}")
-                print(f"     Type: {project_type}")
-                print()
+            _write_lines(_project_lines(projects))
         else:
             handle_error(resp)
     except Exception as e:
@@ -211,17 +416,16 @@ def cmd_projects(args):
 
 def cmd_licenses(args):
     """List licenses for a project."""
-    headers = check_logged_in()
+    check_logged_in()
     api_url = get_api_base()
     project_id = args.project_id
 
     try:
-        resp = requests.get(
-            f"{api_url}/licenses?project_id={project_id}", headers=headers, timeout=10
+        resp, licenses = _get_cached_json(
+            f"{api_url}/licenses", params={"project_id": project_id}
         )
 
-        if resp.status_code == 200:
-            licenses = resp.json()
+        if licenses is not None:
             print_header(f"Licenses for Project: {project_id[:16]}...")
 
             if not licenses:
@@ -231,15 +435,7 @@ def cmd_licenses(args):
                 )
                 return
 
-            for i, lic in enumerate(licenses, 1):
-                status_color = Colors.GREEN if lic["status"] == "active" else Colors.RED
-                print(f"  {Colors.BOLD}{i}. {lic['license_key']}{Colors.RESET}")
-                print(f"     Status: {status_color}{lic['status']}{Colors.RESET}")
-                if lic.get("client_name"):
-                    print(f"     Client: {lic['client_name']}")
-                if lic.get("expires_at"):
-                    print(f"     Expires: {lic['expires_at']}")
-                print()
+            _write_lines(_license_lines(licenses))
         else:
             handle_error(resp)
     except Exception as e:
@@ -248,54 +444,77 @@ def cmd_licenses(args):
 
 def cmd_status(args):
     """Show current status and environment."""
+    from concurrent.futures import ThreadPoolExecutor
+    from env_cache import get_nuitka_version, get_node_version
+
+    # Both probes may have to do real work on a cold cache (a metadata scan,
+    # a node process), so start them before printing anything
+    probe_pool = ThreadPoolExecutor(max_workers=2)
+    nuitka_future = probe_pool.submit(get_nuitka_version)
+    node_future = probe_pool.submit(get_node_version)
+    probe_pool.shutdown(wait=False)
+
     config = load_config()
     print_header("License Wrapper CLI - Status")
 
-    if config.get("api_key"):
+    if config.get("api_key") and not token_expired(config["api_key"]):
         color_print(
             f"  ✅ Logged in as: {config.get('email', 'Unknown')}", Colors.GREEN
         )
         color_print(
             f"     API URL: {config.get('api_url', DEFAULT_API_BASE)}", Colors.CYAN
         )
+    elif config.get("api_key"):
+        color_print("  ❌ Session expired (run 'lw-compiler login')", Colors.RED)
     else:
         color_print("  ❌ Not logged in", Colors.RED)
 
     print()
     print("  Checking dependencies...")
 
-    # Check Nuitka
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "nuitka", "--version"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            version = (
-                result.stdout.strip().split("\n")[0] if result.stdout else "Unknown"
-            )
-            color_print(f"  ✅ Nuitka: {version}", Colors.GREEN)
-        else:
-            color_print("  ❌ Nuitka: Not installed", Colors.RED)
-            color_print("     Install with: pip install nuitka", Colors.YELLOW)
-    except Exception:
-        color_print("  ❌ Nuitka: Not found", Colors.RED)
+    # Check Nuitka (package metadata, cached per interpreter; no subprocess)
+    nuitka_version = nuitka_future.result()
+    if nuitka_version:
+        color_print(f"  ✅ Nuitka: {nuitka_version}", Colors.GREEN)
+    else:
+        color_print("  ❌ Nuitka: Not installed", Colors.RED)
+        color_print("     Install with: pip install nuitka", Colors.YELLOW)
 
-    # Check Node.js / pkg
-    try:
-        result = subprocess.run(["node", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            color_print(f"  ✅ Node.js: {result.stdout.strip()}", Colors.GREEN)
-        else:
-            color_print("  ❌ Node.js: Not installed", Colors.YELLOW)
-    except Exception:
+    # Check Node.js / pkg (version cached per node executable)
+    node_version = node_future.result()
+    if node_version:
+        color_print(f"  ✅ Node.js: {node_version}", Colors.GREEN)
+    else:
         color_print("  ❌ Node.js: Not found", Colors.YELLOW)
 
     color_print(f"  ✅ Python: {sys.version.split()[0]}", Colors.GREEN)
     print()
 
 
+def cmd_cache(args):
+    """Show or clear the local build cache."""
+    import build_cache
+
+    if args.action == "clear":
+        freed, in_use = build_cache.clear()
+        color_print(
+            f"✅ Build cache cleared ({freed / (1024 * 1024):.1f} MB freed).",
+            Colors.GREEN,
+        )
+        if in_use:
+            color_print(
+                f"⚠️ Kept {len(in_use)} workspace(s) in use by a running build: "
+                + ", ".join(in_use),
+                Colors.YELLOW,
+            )
+        return
+
+    print_header("License Wrapper CLI - Build Cache")
+    print(f"  Location: {build_cache.CACHE_DIR}")
+    print(f"  Size: {build_cache.cache_size() / (1024 * 1024):.1f} MB")
+    print()
+
+
 # =============================================================================
 # Build Command
 # =============================================================================
@@ -325,11 +544,21 @@ def cmd_build(args):
         run_local_build(args)
         return
 
-    headers = check_logged_in()
+    import shutil
+    import tempfile
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import ExitStack
+
+    import build_cache
+
+    requests = _ensure_requests()
+    check_logged_in()
+    session = _get_session()
     api_url = get_api_base()
 
     if not project_id:
-        project_id, interactive_license = interactive_build(headers, api_url)
+        project_id, interactive_license = interactive_build(api_url)
         if not project_id:
             return
         # Only override if not in open mode and license was selected
@@ -339,35 +568,63 @@ def cmd_build(args):
     print_header("CodeVault CLI - Local Compilation")
     print()
 
+    # The bundle request does not depend on the config response, so start it
+    # now and let its headers arrive while the config is fetched and printed.
+    bundle_params = {}
+    if license_key:
+        # Get license_id from the license key if possible
+        bundle_params["license_id"] = license_key  # Will be ignored if not a valid ID
+    # Revalidate the last bundle for this project; 304 skips the download
+    cached_bundle = (
+        None if args.force_rebuild else build_cache.cached_bundle(project_id)
+    )
+    bundle_headers = {}
+    if cached_bundle:
+        bundle_headers["If-None-Match"] = cached_bundle[0]
+    if _have_zstd():
+        bundle_headers["Accept-Encoding"] = "zstd, gzip"
+    fetch_pool = ThreadPoolExecutor(max_workers=1)
+    bundle_future = fetch_pool.submit(
+        session.get,
+        f"{api_url}/projects/{project_id}/build-bundle",
+        params=bundle_params,
+        headers=bundle_headers,
+        timeout=_BUNDLE_TIMEOUT,
+        stream=True,  # Stream for progress indication
+    )
+    fetch_pool.shutdown(wait=False)
+
     try:
         # Step 1: Get compile config
         color_print("[1/5] Fetching project configuration...", Colors.BLUE)
         params = {}
         if license_key:
             params["license_key"] = license_key
-        resp = requests.get(
-            f"{api_url}/projects/{project_id}/compile-config",
-            headers=headers,
-            params=params,
-            timeout=10,
+        # Revalidated against the disk cache like the project/license lists
+        resp, config = _get_cached_json(
+            f"{api_url}/projects/{project_id}/compile-config", params=params
         )
 
-        if resp.status_code != 200:
+        if config is None:
             handle_error(resp)
             return
-
-        config = resp.json()
         print(f"      Project: {config['project_name']}")
         print(f"      Entry file: {config['entry_file']}")
         print(f"      Output: {config['output_name']}.exe")
 
         if args.language:
             config["language"] = args.language
+        if args.onefile:
+            config.setdefault("nuitka_options", {})["onefile"] = True
+        if args.include_all:
+            config.setdefault("nuitka_options", {})["include_all"] = True
+        if args.slim:
+            config.setdefault("nuitka_options", {})["slim"] = True
 
         # Auto-detect language from entry file extension if not set
         if not config.get("language"):
             entry_ext = Path(config.get("entry_file", "")).suffix.lower()
-            if entry_ext in [".js", ".mjs", ".cjs", ".ts"]:
+            if entry_ext in _JS_EXTS:
                 config["language"] = "nodejs"
                 print("      🔍 Auto-detected: Node.js project")
             else:
@@ -378,82 +635,67 @@ def cmd_build(args):
 
         # Step 2: Download project bundle
         color_print("\n[2/5] Downloading project bundle...", Colors.BLUE)
-        bundle_params = {}
-        if license_key:
-            # Get license_id from the license key if possible
-            bundle_params["license_id"] = (
-                license_key  # Will be ignored if not a valid ID
-            )
-
-        resp = requests.get(
-            f"{api_url}/projects/{project_id}/build-bundle",
-            headers=headers,
-            params=bundle_params,
-            timeout=120,  # Longer timeout for larger projects
-            stream=True,  # Stream for progress indication
-        )
+        resp = bundle_future.result()
 
         if resp.status_code == 400:
-            error_data = (
-                resp.json()
-                if resp.headers.get("content-type", "").startswith("application/json")
-                else {}
-            )
-            detail = error_data.get("detail", "Unknown error")
-            if "No source files" in detail:
+            if "No source files" in _error_detail(resp):
                 color_print("\n❌ Error: No source files found.", Colors.RED)
                 color_print(
                     "   Please upload a project ZIP via the web interface first.",
                     Colors.YELLOW,
                 )
+                resp.close()
                 return
             handle_error(resp)
+            resp.close()
             return
+        elif resp.status_code == 304 and cached_bundle:
+            resp.close()
+            print("      Bundle unchanged since last build, using cached copy")
         elif resp.status_code != 200:
             handle_error(resp)
+            resp.close()
             return
 
-        # Create temp directory for build
-        with tempfile.TemporaryDirectory() as tmpdir:
+        # Temp directory for oversized bundles and, when another build has
+        # the cached workspace locked, for this build's workspace
+        with tempfile.TemporaryDirectory() as tmpdir, ExitStack() as cleanup:
             tmpdir = Path(tmpdir)
-            bundle_path = tmpdir / "bundle.zip"
-
-            # Download with progress indication
-            total_size = int(resp.headers.get("content-length", 0))
-            downloaded = 0
-            with open(bundle_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            pct = int(downloaded * 100 / total_size)
-                            print(f"\r      Downloaded: {pct}%", end="", flush=True)
-            print()  # New line after progress
-
-            project_dir = tmpdir / "project"
-            project_dir.mkdir()
-
-            # Step 3: Extract files
+            if resp.status_code == 304:
+                bundle = cached_bundle[1]
+            else:
+                bundle = download_bundle(resp, tmpdir / "bundle.zip")
+
+            # Step 3: Extract files into the persistent workspace for this
+            # source tree so warm rebuilds keep node_modules / Nuitka state
             color_print("[3/5] Extracting source files...", Colors.BLUE)
             try:
-                with zipfile.ZipFile(bundle_path, "r") as zf:
-                    zf.extractall(project_dir)
+                workspace, project_dir, build_meta, lock = prepare_workspace(
+                    bundle, force_rebuild=args.force_rebuild, fallback_dir=tmpdir
+                )
             except zipfile.BadZipFile:
                 color_print("❌ Error: Invalid bundle file received.", Colors.RED)
                 return
+            except ValueError as e:
+                color_print(f"❌ Error: {e}", Colors.RED)
+                return
+            # Hold the workspace lock until the build is over
+            cleanup.callback(build_cache.release, lock)
+            etag = resp.headers.get("ETag")
+            if resp.status_code == 200 and etag and lock is not None:
+                build_cache.remember_bundle(project_id, etag, workspace, bundle)
 
             # Check for config.json in bundle and merge with fetched config
             bundle_config_path = project_dir / "config.json"
             if bundle_config_path.exists():
                 try:
-                    bundle_config = json.loads(bundle_config_path.read_text())
+                    bundle_config = parse_json(bundle_config_path.read_bytes())
                     # Merge bundle config (it takes precedence for server-side settings)
-                    for key in ["license_key", "api_url", "server_url", "language"]:
+                    for key in _BUNDLE_CONFIG_KEYS:
                         if key in bundle_config and bundle_config[key]:
                             config[key] = bundle_config[key]
                     print("      Loaded config from bundle")
-                except json.JSONDecodeError:
+                except ValueError:  # Invalid JSON
                     pass
 
             # Source files are in the 'source' subdirectory
@@ -462,18 +704,22 @@ def cmd_build(args):
                 # Fallback: files might be at project_dir root
                 source_dir = project_dir
 
-            file_count = sum(1 for _ in source_dir.rglob("*") if _.is_file())
+            # Index the sources once; entry-file lookups reuse it
+            config["_file_index"], file_count = index_files(source_dir)
             print(f"      Extracted {file_count} files")
 
             # Step 4: Inject license wrapper
             color_print("[4/5] Injecting license protection...", Colors.BLUE)
             effective_license = license_key or config.get("license_key")
+            injected = None
             if effective_license:
                 config["license_key"] = effective_license
                 if lang == "nodejs":
-                    inject_js_wrapper(source_dir / config["entry_file"], config)
+                    injected = inject_js_wrapper(
+                        source_dir / config["entry_file"], config
+                    )
                 else:
-                    inject_license_wrapper(source_dir, config)
+                    injected = inject_license_wrapper(source_dir, config)
                 print(
                     f"      License mode: {'Generic (runtime prompt)' if effective_license == 'GENERIC_BUILD' else 'Fixed key'}"
                 )
@@ -485,18 +731,32 @@ def cmd_build(args):
             # Re-apply auto-detection in case bundle config didn't have language set
             if not config.get("language"):
                 entry_ext = Path(config.get("entry_file", "")).suffix.lower()
-                if entry_ext in [".js", ".mjs", ".cjs", ".ts"]:
+                if entry_ext in _JS_EXTS:
                     config["language"] = "nodejs"
                 else:
                     config["language"] = "python"
             lang = config.get("language")
             compiler_name = "pkg" if lang == "nodejs" else "Nuitka"
+
+            # Record what this build modifies so the next reuse restores it,
+            # and drop stale Nuitka state if the compile options changed
+            build_meta["modified"] = (
+                [injected.relative_to(project_dir).as_posix()] if injected else []
+            )
+            cfg_hash = build_cache.config_hash(config)
+            if build_meta.get("config_hash") not in (None, cfg_hash):
+                for stale in source_dir.glob("*.build"):
+                    shutil.rmtree(stale, ignore_errors=True)
+            build_meta["config_hash"] = cfg_hash
+            build_cache.write_meta(workspace, build_meta)
+            build_cache.prune()
+
             color_print(
                 f"\n[5/5] Compiling with {compiler_name}... (this may take 2-5 minutes)",
                 Colors.BLUE,
             )
 
-            success = run_compiler(source_dir, config)
+            success = run_compiler(source_dir, config, keep_build=True)
 
             if success:
                 copy_output(source_dir, config, effective_license, args.output)
@@ -518,10 +778,50 @@ def cmd_build(args):
         import traceback
 
         traceback.print_exc()
+    finally:
+        # However the build ended, free the prefetched bundle's connection
+        # once the response arrives (a no-op if it was already consumed)
+        bundle_future.add_done_callback(_close_response_future)
+
+
+# Files the build edits in place (run_pkg, npm install), so they must never
+# be hard links back into the user's source tree
+_LOCAL_BUILD_COPIED = frozenset({"package.json", "package-lock.json"})
+
+
+# Names never copied from the source tree for a local build
+_LOCAL_BUILD_IGNORE = frozenset(
+    {"__pycache__", "node_modules", ".git", ".env", "dist", "build", "output"}
+)
+
+
+def _ignore_local_build_names(path, names):
+    """copytree ignore callback; the same set serves every directory."""
+    return _LOCAL_BUILD_IGNORE
+
+
+def _link_or_copy(src, dst):
+    """copytree copy_function: hard-link src to dst, copying when it can't.
+
+    The entry-file injections write a new file and rename it over the link,
+    so the original source is never modified through it.
+    """
+    import shutil
+
+    if os.path.basename(src) not in _LOCAL_BUILD_COPIED:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:  # Other filesystem, or links unsupported
+            pass
+    return shutil.copy2(src, dst)
 
 
 def run_local_build(args):
     """Run build on a local file without Server communication."""
+    import shutil
+    import tempfile
+
     entry_path = Path(args.project_id).resolve()
     if not entry_path.exists():
         print(f"[ERROR] File not found: {entry_path}", flush=True)
@@ -535,9 +835,10 @@ def run_local_build(args):
         "entry_file": entry_path.name,
         "output_name": Path(args.output).stem if args.output else entry_path.stem,
         "language": args.language
-        or ("nodejs" if entry_path.suffix == ".js" else "python"),
+        or ("nodejs" if entry_path.suffix.lower() in _JS_EXTS else "python"),
         "license_key": args.license or "GENERIC_BUILD",
         "server_url": args.api_url or DEFAULT_API_BASE,
+        "nuitka_options": {"onefile": args.onefile, "slim": args.slim},
     }
 
     if args.generic:
@@ -559,19 +860,12 @@ def run_local_build(args):
         source_dir = entry_path.parent
         print(f"[BUILD] Preparing source from: {source_dir}", flush=True)
 
-        def ignore_patterns(path, names):
-            return {
-                "__pycache__",
-                "node_modules",
-                ".git",
-                ".env",
-                "dist",
-                "build",
-                "output",
-            }
-
         shutil.copytree(
-            source_dir, tmp_project_dir, ignore=ignore_patterns, dirs_exist_ok=True
+            source_dir,
+            tmp_project_dir,
+            ignore=_ignore_local_build_names,
+            dirs_exist_ok=True,
+            copy_function=_link_or_copy,
         )
 
         # Step 1: Inject license
@@ -593,15 +887,22 @@ def run_local_build(args):
             print("[ERROR] Compilation failed.", flush=True)
 
 
-def interactive_build(headers, api_url):
+def interactive_build(api_url):
     """Interactive project and license selection."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Licenses carry their project_id, so fetch the whole list alongside the
+    # projects; it is ready by the time the user has picked a project.
+    fetch_pool = ThreadPoolExecutor(max_workers=1)
+    licenses_future = fetch_pool.submit(_get_cached_json, f"{api_url}/licenses")
+    fetch_pool.shutdown(wait=False)
+
     try:
-        resp = requests.get(f"{api_url}/projects", headers=headers, timeout=10)
-        if resp.status_code != 200:
+        resp, projects = _get_cached_json(f"{api_url}/projects")
+        if projects is None:
             handle_error(resp)
             return None, None
 
-        projects = resp.json()
         if not projects:
             color_print(
                 "❌ No projects found. Create one on the web dashboard.", Colors.RED
@@ -609,8 +910,12 @@ def interactive_build(headers, api_url):
             return None, None
 
         print(f"\n{Colors.CYAN}Select a project to build:{Colors.RESET}\n")
-        for i, p in enumerate(projects, 1):
-            print(f"  {i}. {p['name']} ({p['id'][:16]}...)")
+        _write_lines(
+            [
+                f"  {i}. {p['name']} ({p['id'][:16]}...)"
+                for i, p in enumerate(projects, 1)
+            ]
+        )
 
         try:
             choice = int(input("\nEnter number: ").strip())
@@ -623,32 +928,33 @@ def interactive_build(headers, api_url):
 
         project_id = project["id"]
 
-        resp = requests.get(
-            f"{api_url}/licenses?project_id={project_id}", headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            licenses = resp.json()
-            if licenses:
-                active_licenses = [lic for lic in licenses if lic["status"] == "active"]
-                if active_licenses:
-                    print(
-                        f"\n{Colors.CYAN}Select a license (or 0 for no license):{Colors.RESET}\n"
+        try:
+            _resp, licenses = licenses_future.result()
+        except Exception:
+            licenses = None
+        if licenses:
+            active_licenses = [
+                lic
+                for lic in licenses
+                if lic["status"] == "active" and lic.get("project_id") == project_id
+            ]
+            if active_licenses:
+                print(
+                    f"\n{Colors.CYAN}Select a license (or 0 for no license):{Colors.RESET}\n"
+                )
+                print("  0. No license (demo mode)")
+                for i, lic in enumerate(active_licenses, 1):
+                    client = (
+                        f" - {lic['client_name']}" if lic.get("client_name") else ""
                     )
-                    print("  0. No license (demo mode)")
-                    for i, lic in enumerate(active_licenses, 1):
-                        client = (
-                            f" - {lic['client_name']}" if lic.get("client_name") else ""
-                        )
-                        print(f"  {i}. {lic['license_key']}{client}")
-
-                    try:
-                        choice = int(input("\nEnter number: ").strip())
-                        if choice > 0 and choice <= len(active_licenses):
-                            return project_id, active_licenses[choice - 1][
-                                "license_key"
-                            ]
-                    except (ValueError, IndexError):
-                        pass
+                    print(f"  {i}. {lic['license_key']}{client}")
+
+                try:
+                    choice = int(input("\nEnter number: ").strip())
+                    if choice > 0 and choice <= len(active_licenses):
+                        return project_id, active_licenses[choice - 1]["license_key"]
+                except (ValueError, IndexError):
+                    pass
 
         return project_id, None
 
@@ -657,27 +963,403 @@ def interactive_build(headers, api_url):
         return None, None
 
 
-def inject_license_wrapper(project_dir: Path, config: dict):
-    """Inject license validation code into entry file."""
-    entry_file = project_dir / config["entry_file"]
+# Bundles up to this size are kept in memory instead of written to disk
+_BUNDLE_SPOOL_LIMIT = 64 * 1024 * 1024
+# Read size for bundle downloads; large reads keep the per-chunk Python work
+# (decoding, bookkeeping, progress) negligible next to the transfer itself
+_BUNDLE_CHUNK_SIZE = 1 << 20
+# Fixed width, so a shorter percentage never leaves stale digits behind
+_DOWNLOAD_PROGRESS = "\r      Downloaded: %3d%%"
+
+
+def _have_zstd() -> bool:
+    """Check whether zstd-encoded bundles can be decoded (zstandard installed)."""
+    import importlib.util
+
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def _bundle_chunks(resp, chunk_size: int = _BUNDLE_CHUNK_SIZE):
+    """Yield the decoded body of a bundle response.
+
+    zstd is decoded here rather than left to urllib3, whose zstd support
+    depends on its version and on which zstd module is installed.
+    """
+    if resp.headers.get("content-encoding", "").lower() == "zstd":
+        import zstandard
+
+        decoder = zstandard.ZstdDecompressor().decompressobj()
+        for chunk in resp.raw.stream(chunk_size, decode_content=False):
+            yield decoder.decompress(chunk)
+    else:
+        yield from resp.iter_content(chunk_size=chunk_size)
+
+
+def download_bundle(resp, spill_path: Path):
+    """Stream a bundle download, keeping it in memory when it is small.
+
+    Returns the bundle as bytes, or spill_path if it was larger than
+    _BUNDLE_SPOOL_LIMIT and went to disk instead. Closing the response hands
+    the connection back to the session pool.
+    """
+    # Content-Length counts wire bytes, which differ from the decoded size
+    # for a zstd-encoded bundle; progress follows the wire
+    total_size = int(resp.headers.get("content-length", 0))
+    chunks = []
+    spill = None
+    downloaded = 0
+    shown_pct = -1
+    try:
+        with resp:
+            if total_size > _BUNDLE_SPOOL_LIMIT:
+                spill = open(spill_path, "wb")
+            for chunk in _bundle_chunks(resp):
+                if not chunk:
+                    continue
+                if spill is not None:
+                    spill.write(chunk)
+                else:
+                    chunks.append(chunk)
+                downloaded += len(chunk)
+                if spill is None and downloaded > _BUNDLE_SPOOL_LIMIT:
+                    # No (or a wrong) Content-Length; move what we have to disk
+                    spill = open(spill_path, "wb")
+                    spill.writelines(chunks)
+                    chunks = []
+                if total_size > 0:
+                    # Redraw (and flush) only when the percentage moves
+                    pct = min(100, resp.raw.tell() * 100 // total_size)
+                    if pct != shown_pct:
+                        shown_pct = pct
+                        print(_DOWNLOAD_PROGRESS % pct, end="", flush=True)
+    finally:
+        if spill is not None:
+            spill.close()
+    print()  # New line after progress
+    return spill_path if spill is not None else b"".join(chunks)
+
+
+def open_bundle(bundle):
+    """Open a bundle held in memory (bytes) or on disk (path) as a ZipFile."""
+    import io
+    import zipfile
+
+    if isinstance(bundle, bytes):
+        # BytesIO over bytes shares the buffer, so every handle is zero-copy
+        bundle = io.BytesIO(bundle)
+    return zipfile.ZipFile(bundle, "r")
+
+
+# Bundle entries that are never needed to build (caches, VCS data, deps
+# that npm reinstalls)
+_SKIP_DIRS_IN_BUNDLE = {"__pycache__", ".git", "node_modules"}
+_SKIP_FILES_IN_BUNDLE = {".DS_Store"}
+
+
+def bundle_members(zf) -> list:
+    """List the bundle members worth extracting.
+
+    Raises ValueError for absolute or parent-relative member names, which
+    would otherwise be written outside the destination (Zip Slip).
+    """
+    members = []
+    for info in zf.infolist():
+        name = info.filename.replace("\\", "/")
+        parts = name.split("/")
+        if name.startswith("/") or ".." in parts or ":" in parts[0]:
+            raise ValueError(f"Unsafe path in bundle: {info.filename}")
+        if _SKIP_DIRS_IN_BUNDLE.intersection(parts[:-1]):
+            continue
+        if parts[-1] in _SKIP_FILES_IN_BUNDLE or name.endswith(".pyc"):
+            continue
+        members.append(info)
+    return members
+
+
+def extract_bundle(bundle, dest: Path, workers: int = None):
+    """Extract a bundle ZIP, spreading members over a thread pool.
+
+    ZipFile handles keep a file position, so each worker thread opens its own.
+    The directory tree is created up front so workers never race on it.
+    Small bundles are extracted serially since threads would not pay off.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    with open_bundle(bundle) as zf:
+        members = bundle_members(zf)
+        if len(members) < 16:
+            zf.extractall(dest, members=members)
+            return
+
+    dirs = set()
+    files = []
+    for info in members:
+        name = info.filename.rstrip("/")
+        if info.is_dir():
+            dirs.add(name)
+        else:
+            dirs.add(os.path.dirname(name))
+            files.append(info)
+    for d in sorted(dirs):
+        os.makedirs(os.path.join(dest, d), exist_ok=True)
+
+    local = threading.local()
+    handles = []
+
+    def extract(info):
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = open_bundle(bundle)
+            handles.append(zf)
+        zf.extract(info, dest)
+
+    workers = workers or min(8, os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(extract, files))
+    finally:
+        for zf in handles:
+            zf.close()
 
-    if not entry_file.exists():
-        for f in project_dir.rglob("*.py"):
-            if f.name == config["entry_file"] or f.name == "main.py":
-                entry_file = f
-                break
+
+def prepare_workspace(bundle, force_rebuild: bool = False, fallback_dir=None):
+    """Extract a bundle into its cached workspace, reusing an earlier extract.
+
+    Returns (workspace, project_dir, meta, lock). When the sources are
+    unchanged only config.json and the files the last build modified (the
+    injected entry file) are restored from the bundle. force_rebuild discards
+    the cached workspace and its build state first.
+
+    The cached workspace is locked for the caller's build; release ``lock``
+    with build_cache.release() when done. If another build holds it, the
+    bundle is extracted fresh under ``fallback_dir`` (a temp directory the
+    caller removes) and lock is None.
+    """
+    import shutil
+
+    import build_cache
+
+    with open_bundle(bundle) as zf:
+        src_hash = build_cache.source_hash(zf)
+    workspace = build_cache.workspace_for(src_hash)
+
+    lock = build_cache.try_lock(workspace)
+    if lock is None:
+        if fallback_dir is None:
+            raise RuntimeError("Build workspace is in use by another build")
+        print("      Workspace busy (another build); using a temporary one")
+        workspace = Path(fallback_dir) / "workspace"
+        project_dir = workspace / "project"
+        project_dir.mkdir(parents=True)
+        extract_bundle(bundle, project_dir)
+        return workspace, project_dir, {"source_hash": src_hash}, None
+
+    try:
+        project_dir = workspace / "project"
+        meta = build_cache.read_meta(workspace)
+        reusable = meta.get("source_hash") == src_hash and project_dir.is_dir()
+        if reusable and not force_rebuild:
+            with open_bundle(bundle) as zf:
+                names = set(zf.namelist())
+                for name in meta.get("modified", []) + ["config.json"]:
+                    if name in names:
+                        zf.extract(name, project_dir)
+            print("      Reusing cached build workspace")
+            return workspace, project_dir, meta, lock
+
+        if not isinstance(bundle, bytes) and workspace in Path(bundle).parents:
+            # The cached bundle lives in the workspace about to be wiped
+            bundle = Path(bundle).read_bytes()
+        shutil.rmtree(workspace, ignore_errors=True)
+        project_dir.mkdir(parents=True)
+        extract_bundle(bundle, project_dir)
+    except BaseException:
+        build_cache.release(lock)
+        raise
+    return workspace, project_dir, {"source_hash": src_hash}, lock
+
+
+# Nuitka output directories left in a reused workspace (not project sources)
+_BUILD_OUTPUT_SUFFIXES = (".build", ".dist", ".onefile-build")
+
+
+def index_files(root: Path):
+    """Map file names to paths for the project sources under root.
+
+    Returns (index, file_count) from one breadth-first os.scandir pass, so
+    the shallowest file wins for each name. Dependency/VCS directories and
+    Nuitka output directories are skipped.
+    """
+    from collections import deque
+
+    index = {}
+    count = 0
+    pending = deque([root])
+    while pending:
+        try:
+            entries = os.scandir(pending.popleft())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name not in _SCAN_SKIP_DIRS and not name.endswith(
+                        _BUILD_OUTPUT_SUFFIXES
+                    ):
+                        pending.append(entry.path)
+                else:
+                    count += 1
+                    if entry.name not in index:
+                        index[entry.name] = Path(entry.path)
+    return index, count
+
+
+def imported_modules(root: Path) -> set:
+    """Collect the dotted module names imported by the .py files under root.
+
+    Uses a static ast scan; ``from a import b`` records both "a" and "a.b"
+    (b may be a submodule) and relative imports are resolved against the
+    file's package. Files that fail to parse are skipped.
+    """
+    import ast
+
+    modules = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d not in _SCAN_SKIP_DIRS and not d.endswith(_BUILD_OUTPUT_SUFFIXES)
+        ]
+        package = Path(dirpath).relative_to(root).parts
+        for name in filenames:
+            if not name.endswith(".py"):
+                continue
+            try:
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    source = f.read()
+                if b"import" not in source:
+                    continue
+                tree = ast.parse(source)
+            except (OSError, SyntaxError, ValueError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    modules.update(alias.name for alias in node.names)
+                elif isinstance(node, ast.ImportFrom):
+                    if node.level:
+                        base = list(package[: len(package) - node.level + 1])
+                        if node.module:
+                            base.append(node.module)
+                        module = ".".join(base)
+                    else:
+                        module = node.module
+                    if module:
+                        modules.add(module)
+                    prefix = f"{module}." if module else ""
+                    modules.update(prefix + alias.name for alias in node.names)
+    return modules
+
+
+def find_entry_file(project_dir: Path, entry_file: str, index: dict = None) -> Path:
+    """Locate the entry file, searching the tree by name if needed.
+
+    Falls back to the first file with the entry file's name, else a main.py,
+    taken from ``index`` (see index_files) when given or found in one os.walk.
+    Returns project_dir / entry_file (which may not exist) when neither is
+    found.
+    """
+    direct = project_dir / entry_file
+    if direct.exists():
+        return direct
+
+    wanted = Path(entry_file).name
+    if index is not None:
+        return index.get(wanted) or index.get("main.py") or direct
+
+    fallback = None
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = [d for d in dirs if d not in _SCAN_SKIP_DIRS]
+        if wanted in files:
+            return Path(root) / wanted
+        if fallback is None and "main.py" in files:
+            fallback = Path(root) / "main.py"
+    return fallback or direct
+
+
+def resolve_entry_file(project_dir: Path, config: dict) -> Path:
+    """find_entry_file() for a build, memoized in config["_entry_path"].
+
+    The wrapper injection and the compiler both need the entry file, so the
+    tree is searched at most once per build.
+    """
+    cached = config.get("_entry_path")
+    if cached is not None and cached[0] == project_dir:
+        return cached[1]
+    entry_path = find_entry_file(
+        project_dir, config["entry_file"], config.get("_file_index")
+    )
+    config["_entry_path"] = (project_dir, entry_path)
+    return entry_path
+
+
+def _prepend_python_wrapper(entry_file: Path, wrapper: bytes):
+    """Put wrapper in front of entry_file's code, replacing the file atomically."""
+    import shutil
+
+    # Write the wrapper, then stream the original bytes after it (no decode,
+    # no in-memory copy); the finished file atomically replaces the entry
+    tmp = entry_file.with_name(entry_file.name + ".tmp")
+    with entry_file.open("rb") as src, tmp.open("wb") as dst:
+        dst.write(wrapper)
+        head = src.read(len(codecs.BOM_UTF8))
+        if head != codecs.BOM_UTF8:  # A BOM after the wrapper is a syntax error
+            dst.write(head)
+        shutil.copyfileobj(src, dst, 1 << 20)
+    shutil.copymode(entry_file, tmp)
+    os.replace(tmp, entry_file)
+    print(f"[BUILD] Injected wrapper into: {entry_file.name}", flush=True)
+
+
+def inject_license_wrapper(project_dir: Path, config: dict, extra_entries=()):
+    """Inject license validation code into entry file.
+
+    ``extra_entries`` (paths relative to project_dir) get the same wrapper,
+    for projects with more than one launchable script; the files are
+    rewritten on a thread pool.
+
+    Returns the path of the modified file, or None if it was not found.
+    """
+    from wrappers import get_python_wrapper
+
+    entry_file = resolve_entry_file(project_dir, config)
 
     if not entry_file.exists():
         print(f"[WARN] Entry file not found: {config['entry_file']}", flush=True)
         return
 
-    original_code = entry_file.read_text(encoding="utf-8")
     license_key = config.get("license_key", "DEMO")
     server_url = config.get("server_url", "http://localhost:8000")
+    wrapper = get_python_wrapper(license_key, server_url).encode("utf-8")
+
+    entries = [entry_file]
+    for rel in extra_entries:
+        path = project_dir / rel
+        if not path.is_file():
+            print(f"[WARN] Entry file not found: {rel}", flush=True)
+        elif path not in entries:  # Never wrap (or race on) a file twice
+            entries.append(path)
+
+    if len(entries) == 1:
+        _prepend_python_wrapper(entry_file, wrapper)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
 
-    wrapper = get_python_wrapper(license_key, server_url)
-    entry_file.write_text(wrapper + original_code, encoding="utf-8")
-    print(f"[BUILD] Injected wrapper into: {entry_file.name}", flush=True)
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as pool:
+            # list() surfaces the first failure
+            list(pool.map(_prepend_python_wrapper, entries, [wrapper] * len(entries)))
+    return entry_file
 
 
 def inject_js_wrapper(entry_file: Path, config: dict):
@@ -688,40 +1370,116 @@ def inject_js_wrapper(entry_file: Path, config: dict):
     - No file renaming
     - No dynamic require()
     - Original code runs inside async IIFE after validation
+
+    Returns the path of the modified file, or None if it was not found.
     """
+    from wrappers import get_nodejs_wrapper_inline
+
     if not entry_file.exists():
         print(f"[WARN] Entry file not found: {entry_file}", flush=True)
         return
 
-    original_code = entry_file.read_text(encoding="utf-8")
+    import shutil
+
     license_key = config.get("license_key", "DEMO")
     server_url = config.get("server_url", "http://localhost:8000")
 
-    # Strip shebang if present (must be on line 1, invalid mid-file)
-    shebang = ""
-    if original_code.startswith("#!"):
-        first_newline = original_code.find("\n")
-        if first_newline != -1:
-            shebang = original_code[: first_newline + 1]  # Include newline
-            original_code = original_code[first_newline + 1 :]
-            print(f"[BUILD] Stripped shebang: {shebang.strip()}", flush=True)
-
     # Get prefix and suffix that wrap code in async IIFE
     prefix, suffix = get_nodejs_wrapper_inline(license_key, server_url)
 
-    # Wrap original code: shebang (if any) + prefix + original + suffix
-    wrapped_code = shebang + prefix + original_code + suffix
-    entry_file.write_text(wrapped_code, encoding="utf-8")
+    # Wrap original code: shebang (if any) + prefix + original + suffix,
+    # streaming the original bytes into a temp file that replaces the entry
+    tmp = entry_file.with_name(entry_file.name + ".tmp")
+    with entry_file.open("rb") as src, tmp.open("wb") as dst:
+        # Strip shebang if present (must be on line 1, invalid mid-file)
+        first_line = src.readline()
+        if first_line.startswith(b"#!") and first_line.endswith(b"\n"):
+            dst.write(first_line)
+            print(
+                f"[BUILD] Stripped shebang: {first_line.decode('utf-8', 'replace').strip()}",
+                flush=True,
+            )
+            first_line = b""
+        dst.write(prefix.encode("utf-8"))
+        dst.write(first_line)
+        shutil.copyfileobj(src, dst, 1 << 20)
+        dst.write(suffix.encode("utf-8"))
+    shutil.copymode(entry_file, tmp)
+    os.replace(tmp, entry_file)
     print(f"[BUILD] Injected JS wrapper into: {entry_file.name}", flush=True)
+    return entry_file
+
+
+def _output_batches(stream):
+    """Yield a child's output as lists of raw lines, one list per read.
 
+    Reads whatever is available (up to 64 KiB) per call and splits it into
+    lines in bulk, holding an incomplete last line back for the next read.
+    A batch may be empty; the unterminated tail comes last.
+    """
+    fd = stream.fileno()
+    pending = bytearray()
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        pending += chunk
+        cut = pending.rfind(b"\n")
+        if cut == -1:
+            yield []
+            continue
+        lines = pending[:cut].split(b"\n")
+        del pending[: cut + 1]
+        yield lines
+    if pending:
+        yield [pending]
 
-def run_compiler(project_dir: Path, config: dict) -> bool:
-    """Dispatch to correct compiler."""
+
+# nice() increment for compiler processes (POSIX); Windows gets BELOW_NORMAL
+_COMPILER_NICENESS = 10
+
+
+def _lower_child_priority():
+    """preexec_fn: run the compiler below the CLI's priority (best-effort)."""
+    try:
+        os.nice(_COMPILER_NICENESS)
+    except OSError:
+        pass
+
+
+def _compiler_priority_kwargs(creationflags: int = 0) -> dict:
+    """Popen kwargs that start a compiler at reduced CPU priority.
+
+    The compiler and its C compiler children inherit it, so a busy build
+    no longer starves the CLI's output loop or the user's terminal.
+    """
+    import subprocess
+
+    if sys.platform == "win32":
+        return {
+            "creationflags": creationflags
+            | getattr(subprocess, "BELOW_NORMAL_PRIORITY_CLASS", 0x00004000)
+        }
+    return {"preexec_fn": _lower_child_priority}
+
+
+def run_compiler(project_dir: Path, config: dict, keep_build: bool = False) -> bool:
+    """Dispatch to correct compiler.
+
+    keep_build leaves intermediate build state in project_dir so a later
+    build of the same workspace can reuse it.
+    """
     lang = config.get("language", "python")
     if lang == "nodejs":
         return run_pkg(project_dir, config)
     else:
-        return run_nuitka(project_dir, config)
+        return run_nuitka(project_dir, config, keep_build=keep_build)
+
+
+# pkg release run through npx when the project does not install its own
+_PKG_NPX_SPEC = "pkg@5.8.1"
+# Bundled as pkg assets so ESM/CJS hybrid modules (axios) work when packed
+_PKG_ASSET_PATTERNS = ("node_modules/**/*.cjs", "node_modules/**/*.json")
 
 
 def run_pkg(project_dir: Path, config: dict) -> bool:
@@ -732,12 +1490,20 @@ def run_pkg(project_dir: Path, config: dict) -> bool:
     2. Run npm install to install dependencies
     3. Run pkg to bundle the app
     """
+    import json
+    import subprocess
+
+    import build_cache
+
     entry_file = config["entry_file"]
     output_name = config.get("output_name") or config.get("project_name") or "output"
 
     compiler_opts = config.get("compiler_options", {})
     target = compiler_opts.get("target", "node18-win-x64")
 
+    # Use npx.cmd on Windows, npx on others
+    npx_cmd = "npx.cmd" if sys.platform == "win32" else "npx"
+
     # Find package.json - could be at project root or in a subdirectory
     package_json = None
     entry_path = project_dir / entry_file
@@ -764,36 +1530,76 @@ def run_pkg(project_dir: Path, config: dict) -> bool:
         pkg_cwd = package_json.parent
         node_modules = pkg_cwd / "node_modules"
 
-        # Downgrade axios if present (v1.x is incompatible with pkg due to ESM/CJS hybrid)
+        # A pkg among the dependencies is installed locally; otherwise npx
+        # has to fetch it
+        needs_npx_pkg = True
+
+        # One read-modify-write of package.json for both fixes below; the file
+        # is only rewritten if one of them changed something
         try:
-            pkg_json_content = json.loads(package_json.read_text(encoding="utf-8"))
+            pkg_json_content = parse_json(package_json.read_bytes())
+            changed = False
+
+            # Downgrade axios if present (v1.x is incompatible with pkg due to ESM/CJS hybrid)
             deps = pkg_json_content.get("dependencies", {})
+            needs_npx_pkg = "pkg" not in deps
             if "axios" in deps:
                 # Check if it's a v1.x version
                 axios_ver = deps["axios"]
-                if (
-                    axios_ver.startswith("^1")
-                    or axios_ver.startswith("~1")
-                    or axios_ver.startswith("1")
-                ):
+                if axios_ver.startswith(("^1", "~1", "1")):
                     # Downgrade to 0.27.2 which is pkg-compatible
                     deps["axios"] = "0.27.2"
-                    pkg_json_content["dependencies"] = deps
-                    package_json.write_text(
-                        json.dumps(pkg_json_content, indent=2), encoding="utf-8"
-                    )
+                    changed = True
                     print("   ⚙️ Downgraded axios to 0.27.2 (pkg compatibility)")
+
+            # Add pkg configuration to bundle .cjs files (fixes axios ESM/CJS issue)
+            pkg_section = pkg_json_content.setdefault("pkg", {})
+            pkg_section.setdefault("scripts", [])
+            assets = pkg_section.setdefault("assets", [])
+            missing = [p for p in _PKG_ASSET_PATTERNS if p not in assets]
+            if missing:
+                assets.extend(missing)
+                changed = True
+                print("   ✅ Added pkg config for ESM/CJS modules")
+
+            if changed:
+                package_json.write_text(
+                    json.dumps(pkg_json_content, indent=2), encoding="utf-8"
+                )
         except Exception as e:
-            print(f"   ⚠️ Could not check axios version: {e}")
+            print(f"   ⚠️ Could not update package.json: {e}")
 
         # Run npm install if node_modules doesn't exist
         if not node_modules.exists():
             print("📦 Installing npm dependencies...")
             npm_cmd = "npm.cmd" if sys.platform == "win32" else "npm"
 
+            # Let npx download pkg itself while npm installs the project
+            pkg_warm = None
+            continuing = False  # Whether the build goes on to the pkg step
+            if needs_npx_pkg:
+                try:
+                    pkg_warm = subprocess.Popen(
+                        [npx_cmd, "-y", _PKG_NPX_SPEC, "--version"],
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                except OSError:
+                    pass
+
             try:
                 result = subprocess.run(
-                    [npm_cmd, "install", "--production"],
+                    # Use cached packages when possible and skip the audit
+                    # and funding requests that only print notices
+                    [
+                        npm_cmd,
+                        "install",
+                        "--production",
+                        "--prefer-offline",
+                        "--no-audit",
+                        "--no-fund",
+                    ],
                     cwd=pkg_cwd,
                     capture_output=True,
                     text=True,
@@ -805,58 +1611,53 @@ def run_pkg(project_dir: Path, config: dict) -> bool:
                         print(result.stderr[:500])
                 else:
                     print("   ✅ Dependencies installed")
+                continuing = True
             except subprocess.TimeoutExpired:
                 color_print("❌ npm install timed out", Colors.RED)
                 return False
             except FileNotFoundError:
                 color_print("❌ npm not found. Install Node.js.", Colors.RED)
                 return False
+            finally:
+                if pkg_warm is not None:
+                    # Only wait for the download when pkg runs next; a failed
+                    # build reports its error straight away
+                    if continuing:
+                        try:
+                            pkg_warm.wait(timeout=120)
+                        except subprocess.TimeoutExpired:
+                            pass
+                    if pkg_warm.poll() is None:
+                        pkg_warm.kill()
+                        pkg_warm.wait()
         else:
             print("   ✅ node_modules already exists")
 
-        # Add pkg configuration to package.json to bundle .cjs files (fixes axios ESM/CJS issue)
-        try:
-            pkg_json_content = json.loads(package_json.read_text(encoding="utf-8"))
-            if "pkg" not in pkg_json_content:
-                pkg_json_content["pkg"] = {}
-
-            # Ensure scripts and assets include .cjs files for ESM/CJS hybrid packages like axios
-            pkg_json_content["pkg"]["scripts"] = pkg_json_content["pkg"].get(
-                "scripts", []
-            )
-            pkg_json_content["pkg"]["assets"] = pkg_json_content["pkg"].get(
-                "assets", []
-            )
-
-            # Add patterns to bundle axios and similar ESM/CJS hybrid modules
-            cjs_pattern = "node_modules/**/*.cjs"
-            if cjs_pattern not in pkg_json_content["pkg"]["assets"]:
-                pkg_json_content["pkg"]["assets"].append(cjs_pattern)
-
-            json_pattern = "node_modules/**/*.json"
-            if json_pattern not in pkg_json_content["pkg"]["assets"]:
-                pkg_json_content["pkg"]["assets"].append(json_pattern)
-
-            package_json.write_text(
-                json.dumps(pkg_json_content, indent=2), encoding="utf-8"
-            )
-            print("   ✅ Added pkg config for ESM/CJS modules")
-        except Exception as e:
-            print(f"   ⚠️ Could not update pkg config: {e}")
-
-    # Use npx.cmd on Windows, npx on others
-    npx_cmd = "npx.cmd" if sys.platform == "win32" else "npx"
-
     # Calculate relative entry path from package.json directory
     if package_json:
         entry_path_rel = entry_path.relative_to(pkg_cwd)
     else:
         entry_path_rel = entry_file
 
+    # A project-local pkg skips npx's registry lookup
+    local_pkg = (
+        pkg_cwd
+        / "node_modules"
+        / ".bin"
+        / ("pkg.cmd" if sys.platform == "win32" else "pkg")
+    )
+    if local_pkg.exists():
+        pkg_cmd = [str(local_pkg)]
+    else:
+        pkg_cmd = [npx_cmd, "-y", _PKG_NPX_SPEC]  # -y: auto-confirm install
+
+    # Keep pkg's downloaded Node base binaries in a per-user directory so
+    # they are fetched once, not once per build
+    build_cache.PKG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    pkg_env = {**os.environ, "PKG_CACHE_PATH": str(build_cache.PKG_CACHE_DIR)}
+
     cmd = [
-        npx_cmd,
-        "-y",  # Auto-confirm package installation
-        "pkg@5.8.1",
+        *pkg_cmd,
         str(entry_path_rel),
         "--targets",
         target,
@@ -868,31 +1669,101 @@ def run_pkg(project_dir: Path, config: dict) -> bool:
     print(f"   CWD: {pkg_cwd}")
 
     try:
-        # Don't capture output, let it stream to console so user sees progress (e.g. downloads)
-        result = subprocess.run(cmd, cwd=pkg_cwd, capture_output=False, text=True)
-        if result.returncode != 0:
-            color_print(f"❌ pkg failed with exit code {result.returncode}", Colors.RED)
+        # Relay pkg's output as it arrives (e.g. base binary downloads),
+        # highlighting warnings and errors
+        process = subprocess.Popen(
+            cmd,
+            cwd=pkg_cwd,
+            env=pkg_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=-1,
+            **_compiler_priority_kwargs(),
+        )
+        with process.stdout:
+            for lines in _output_batches(process.stdout):
+                for line_bytes in lines:
+                    line = line_bytes.decode("utf-8", errors="replace").rstrip()
+                    if not line:
+                        continue
+                    lower = line.lower()
+                    if "error" in lower:
+                        color_print(f"   {line}", Colors.RED)
+                    elif "warning" in lower:
+                        color_print(f"   {line}", Colors.YELLOW)
+                    else:
+                        print(f"   {line}", flush=True)
+        if process.wait() != 0:
+            color_print(
+                f"❌ pkg failed with exit code {process.returncode}", Colors.RED
+            )
             return False
         color_print("✅ pkg completed successfully", Colors.GREEN)
+        # pkg appends .exe for Windows targets
+        config["_output_path"] = pkg_cwd / f"{output_name}.exe"
         return True
     except FileNotFoundError:
         color_print("❌ npx/pkg not found. Install Node.js.", Colors.RED)
         return False
 
 
-def run_nuitka(project_dir: Path, config: dict) -> bool:
+_SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+
+def _spin(stop, lock, start_time: float):
+    """Redraw the "Compiling..." spinner once a second until stop is set."""
+    import time
+
+    frame = 0
+    while not stop.wait(1.0):
+        frame = (frame + 1) % len(_SPINNER_FRAMES)
+        mins, secs = divmod(int(time.time() - start_time), 60)
+        with lock:
+            print(
+                f"\r{_SPINNER_FRAMES[frame]} Compiling... {mins}m {secs}s elapsed  ",
+                end="",
+                flush=True,
+            )
+
+
+# Nuitka output lines containing these (lowercased) are reported as [NUITKA OK]
+_NUITKA_OK_WORDS = ("completed", "success", "done", "creating")
+# Every keyword the classification looks at, matched case-insensitively on
+# the raw bytes; the group numbers double as priorities (lowest wins)
+_NUITKA_KEYWORDS_RE = re.compile(
+    rb"(error)|(warning)|(" + "|".join(_NUITKA_OK_WORDS).encode() + rb")|(compil)",
+    re.IGNORECASE,
+)
+_NUITKA_ERROR_TAG = "\n[NUITKA ERROR]"
+_NUITKA_WARN_TAG = "\n[NUITKA WARN]"
+_NUITKA_OK_TAG = "\n[NUITKA OK]"
+_NUITKA_TAG = "\n[NUITKA]"
+
+# Interpreter flags baked into every build: skip site.py and the warnings
+# machinery at startup
+_NUITKA_PYTHON_FLAGS = ("no_site", "no_warnings")
+# Stdlib/tooling packages that applications rarely need at runtime; not
+# following them keeps them out of Nuitka's optimisation pass. Opt-in only
+# (build --slim or nuitka_options.slim), since a dependency that imports one
+# at runtime would fail in the delivered binary; modules the project sources
+# import, or list in nuitka_options.no_exclude, are always kept
+_NUITKA_NOFOLLOW = ("unittest", "test", "distutils", "setuptools", "pip")
+
+
+def run_nuitka(project_dir: Path, config: dict, keep_build: bool = False) -> bool:
     """Run Nuitka compilation for Python."""
+    import subprocess
+    import threading
+    import time
+
+    import build_cache
+
     entry_file = config["entry_file"]
     # Fix: Fallback to project_name if output_name is empty
     output_name = config.get("output_name") or config.get("project_name") or "output"
     nuitka_opts = config.get("nuitka_options", {})
 
-    entry_path = project_dir / entry_file
-    if not entry_path.exists():
-        for f in project_dir.rglob("*.py"):
-            if f.name == entry_file or f.name == "main.py":
-                entry_path = f
-                break
+    entry_path = resolve_entry_file(project_dir, config)
 
     if not entry_path.exists():
         print(f"[ERROR] Entry file not found: {entry_file}", flush=True)
@@ -903,19 +1774,66 @@ def run_nuitka(project_dir: Path, config: dict) -> bool:
         "-m",
         "nuitka",
         "--standalone",
-        "--onefile",
-        "--remove-output",
         "--assume-yes-for-downloads",
         "--enable-plugin=tk-inter",  # Required for license dialog GUI
+        f"--jobs={os.cpu_count() or 1}",  # Parallel C compilation
+        "--lto=no",  # Link-time optimisation roughly doubles C build time
         f"--output-filename={output_name}.exe",
     ]
-
-    for pkg in nuitka_opts.get("include_packages", []):
-        if pkg and pkg != "__pycache__":
-            # Convert path separators to dots for module names
-            # e.g., "test3_fullstack/backend" -> "test3_fullstack.backend"
-            module_name = pkg.replace("/", ".").replace("\\", ".")
-            cmd.append(f"--include-package={module_name}")
+    if not keep_build:
+        cmd.append("--remove-output")
+    cmd.extend(f"--python-flag={flag}" for flag in _NUITKA_PYTHON_FLAGS)
+    imported = None  # Static import scan of the sources, run on demand
+    if nuitka_opts.get("slim"):
+        imported = imported_modules(project_dir)
+        keep = set(nuitka_opts.get("no_exclude", []))
+        for module in _NUITKA_NOFOLLOW:
+            # Never exclude a package the project provides or imports itself
+            if module in keep or (project_dir / module).is_dir():
+                continue
+            if (project_dir / f"{module}.py").exists():
+                continue
+            if any(m == module or m.startswith(module + ".") for m in imported):
+                continue
+            cmd.append(f"--nofollow-import-to={module}")
+
+    # Onefile packing costs a compression pass per build and a self-extract
+    # on every launch, so it is opt-in; standalone builds ship the .dist folder
+    if nuitka_opts.get("onefile"):
+        cmd.append("--onefile")
+    else:
+        # Don't let copy_output pick up an onefile exe from an earlier build
+        stale_exe = project_dir / f"{output_name}.exe"
+        if stale_exe.is_file():
+            stale_exe.unlink()
+
+    # Convert path separators to dots for module names
+    # e.g., "test3_fullstack/backend" -> "test3_fullstack.backend"
+    include_packages = [
+        pkg.replace("/", ".").replace("\\", ".")
+        for pkg in nuitka_opts.get("include_packages", [])
+        if pkg and pkg != "__pycache__"
+    ]
+    if include_packages and not nuitka_opts.get("include_all"):
+        # Every forced package is compiled in full, so only force the ones
+        # the sources actually import; Nuitka still follows the rest itself
+        if imported is None:
+            imported = imported_modules(project_dir)
+        used = [
+            pkg
+            for pkg in include_packages
+            if any(m == pkg or m.startswith(pkg + ".") for m in imported)
+        ]
+        skipped = len(include_packages) - len(used)
+        if skipped:
+            print(
+                f"[NUITKA] Skipping {skipped} unimported package(s); "
+                "use --include-all to force them",
+                flush=True,
+            )
+        include_packages = used
+    for module_name in include_packages:
+        cmd.append(f"--include-package={module_name}")
 
     cmd.append(str(entry_path))
 
@@ -926,6 +1844,8 @@ def run_nuitka(project_dir: Path, config: dict) -> bool:
         # Force unbuffered output for Nuitka and its children (Scons, cl.exe)
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"
+        # Share compiled C objects between builds when Nuitka uses ccache
+        env.setdefault("CCACHE_DIR", str(build_cache.CCACHE_DIR))
 
         # On Windows, avoid creating a new console window
         creationflags = 0
@@ -941,57 +1861,63 @@ def run_nuitka(project_dir: Path, config: dict) -> bool:
             cwd=project_dir,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            bufsize=0,  # Unbuffered
+            bufsize=-1,  # Read below in large raw chunks, not line by line
             env=env,
-            creationflags=creationflags,
+            **_compiler_priority_kwargs(creationflags),
         )
 
         line_count = 0
-        start_time = time.time()
-        spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        spinner_idx = 0
-        last_spinner_update = 0
-
-        while True:
-            line_bytes = process.stdout.readline()
-            if not line_bytes and process.poll() is not None:
-                break
+        # The spinner ticks on its own thread, so it keeps moving while
+        # Nuitka is silent (C compilation); the lock keeps its updates from
+        # landing in the middle of a reported line
+        console_lock = threading.Lock()
+        stop_spinner = threading.Event()
+        spinner_thread = threading.Thread(
+            target=_spin,
+            args=(stop_spinner, console_lock, time.time()),
+            daemon=True,
+        )
+        spinner_thread.start()
 
-            # Update progress spinner every second
-            elapsed = int(time.time() - start_time)
-            if elapsed != last_spinner_update:
-                last_spinner_update = elapsed
-                spinner_idx = (spinner_idx + 1) % len(spinner)
-                mins, secs = divmod(elapsed, 60)
-                print(
-                    f"\r{spinner[spinner_idx]} Compiling... {mins}m {secs}s elapsed  ",
-                    end="",
-                    flush=True,
+        def report(line_bytes):
+            nonlocal line_count
+            line_bytes = line_bytes.strip()
+            if not line_bytes:
+                return
+            line_count += 1
+            # Classify on the raw bytes; only printed lines get decoded
+            if line_bytes.isdigit():
+                # Bare progress counters can't match any keyword
+                found = 0
+            else:
+                found = min(
+                    (m.lastindex for m in _NUITKA_KEYWORDS_RE.finditer(line_bytes)),
+                    default=0,
                 )
+            # Prefix with [NUITKA] for easy parsing
+            if found == 1:
+                tag = _NUITKA_ERROR_TAG
+            elif found == 2:
+                tag = _NUITKA_WARN_TAG
+            elif found == 3:
+                tag = _NUITKA_OK_TAG
+            # Only print every 10th line for progress, or important ones
+            elif found == 4 or line_count % 10 == 0 or b"Nuitka" in line_bytes:
+                tag = _NUITKA_TAG
+            else:
+                return
+            line = line_bytes.decode("utf-8", errors="replace")
+            with console_lock:
+                print(tag, line, flush=True)
 
-            if line_bytes:
-                # Decode bytes to string with error handling
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if line:
-                    line_count += 1
-                    # Prefix with [NUITKA] for easy parsing
-                    if "error" in line.lower():
-                        print(f"\n[NUITKA ERROR] {line}", flush=True)
-                    elif "warning" in line.lower():
-                        print(f"\n[NUITKA WARN] {line}", flush=True)
-                    elif any(
-                        kw in line.lower()
-                        for kw in ["completed", "success", "done", "creating"]
-                    ):
-                        print(f"\n[NUITKA OK] {line}", flush=True)
-                    else:
-                        # Only print every 10th line for progress, or important ones
-                        if (
-                            line_count % 10 == 0
-                            or "Nuitka" in line
-                            or "compil" in line.lower()
-                        ):
-                            print(f"\n[NUITKA] {line}", flush=True)
+        try:
+            for lines in _output_batches(process.stdout):
+                for line_bytes in lines:
+                    report(line_bytes)
+        finally:
+            stop_spinner.set()
+            spinner_thread.join()
+        process.stdout.close()
 
         # Clear the spinner line
         print("\r" + " " * 50 + "\r", end="", flush=True)
@@ -999,6 +1925,14 @@ def run_nuitka(project_dir: Path, config: dict) -> bool:
 
         if process.returncode == 0:
             print("[NUITKA] Compilation completed successfully!", flush=True)
+            # Nuitka writes into its cwd; standalone builds go in the entry
+            # module's .dist folder
+            if nuitka_opts.get("onefile"):
+                config["_output_path"] = project_dir / f"{output_name}.exe"
+            else:
+                config["_output_path"] = (
+                    project_dir / f"{entry_path.stem}.dist" / f"{output_name}.exe"
+                )
             return True
         else:
             print(
@@ -1020,14 +1954,108 @@ def run_nuitka(project_dir: Path, config: dict) -> bool:
         return False
 
 
-def copy_output(
-    project_dir: Path, config: dict, license_key: str, custom_output: str = None
-):
-    """Copy compiled output to Desktop or custom path."""
-    # Fix: Fallback to project_name if output_name is empty
-    output_name = config.get("output_name") or config.get("project_name") or "output"
-    exe_name = f"{output_name}.exe"
+# Directories never worth descending into when looking for build output
+_SCAN_SKIP_DIRS = {"node_modules", ".git", "__pycache__"}
+
+
+def _scan_files(root: Path, match, max_depth: int = 3):
+    """Yield files under root (at most max_depth levels down) whose name matches."""
+    stack = [(root, 0)]
+    while stack:
+        current, depth = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < max_depth and entry.name not in _SCAN_SKIP_DIRS:
+                        stack.append((Path(entry.path), depth + 1))
+                elif match(entry.name):
+                    yield Path(entry.path)
+
+
+def _copy_file_range(src, dst) -> bool:
+    """Copy src's data to dst with copy_file_range(2), True on success.
+
+    Unlike sendfile, this lets the filesystem clone extents (btrfs, XFS) or
+    copy server-side (NFS, SMB) instead of moving every byte through the
+    kernel. Returns False, leaving dst to be overwritten, where unsupported.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:  # ENOSYS, EXDEV on older kernels, EINVAL, ...
+        return False
+    return remaining <= 0
+
+
+def _copy_file(src, dst):
+    """copy2 that lets the OS do the copy where shutil can't.
 
+    Windows gets CopyFileW (data, attributes and timestamps natively), Linux
+    copy_file_range; otherwise, or if those fail, shutil.copy2, which copies
+    in the kernel with sendfile on Linux and fcopyfile on macOS.
+    """
+    import shutil
+
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if sys.platform == "win32":
+        import ctypes
+
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            return dst
+    elif hasattr(os, "copy_file_range") and _copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+
+# Written into every standalone output folder; only a folder carrying it is
+# ever replaced by a later build
+_OUTPUT_MARKER = ".lw-compiler-output"
+
+
+def _replace_tree(src: Path, dst: Path):
+    """Copy the directory src to dst, replacing an earlier build's copy.
+
+    The copy is made next to dst and swapped in, so files left by an earlier
+    build never end up mixed into the new one. Raises FileExistsError, leaving
+    it untouched, if dst exists but is not an lw-compiler output folder.
+    """
+    import shutil
+
+    if dst.exists() and not (dst / _OUTPUT_MARKER).is_file():
+        raise FileExistsError(f"{dst} exists and was not created by lw-compiler")
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    old = dst.with_name(f".{dst.name}.{os.getpid()}.old")
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        shutil.copytree(src, tmp, copy_function=_copy_file)
+        (tmp / _OUTPUT_MARKER).touch()
+        if dst.exists():
+            # Directories can't be replaced in one step on Windows
+            os.replace(dst, old)
+        try:
+            os.replace(tmp, dst)
+        except OSError:
+            if old.is_dir():  # Put the previous build back
+                os.replace(old, dst)
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _find_output(project_dir: Path, config: dict, output_name: str, exe_name: str):
+    """Search the likely build output locations for the compiled exe."""
     exe_path = None
 
     # For Node.js builds, pkg outputs to pkg_cwd (where package.json is)
@@ -1045,33 +2073,49 @@ def copy_output(
             search_paths.insert(0, parent)  # Priority for Node.js
             break
 
-    # Also check inside subdirectories that might contain package.json
-    for subdir in project_dir.rglob("package.json"):
-        search_paths.insert(0, subdir.parent)
+    # Also check (shallow) subdirectories that might contain package.json
+    for pkg_json in _scan_files(project_dir, lambda name: name == "package.json"):
+        search_paths.insert(0, pkg_json.parent)
 
-    # Search for exe in all locations
+    # Output locations are deterministic, so stat the candidates directly.
+    # Standalone builds land in <entry stem>.dist next to the onefile location.
+    entry_stem = Path(config.get("entry_file") or output_name).stem
     for search_dir in search_paths:
-        if not search_dir.exists():
-            continue
-        # Look for exact match first
-        exact_match = search_dir / exe_name
-        if exact_match.exists():
-            exe_path = exact_match
-            break
-        # Then look for output_name.exe anywhere in directory
-        for p in search_dir.glob("*.exe"):
-            if p.stem == output_name or output_name in p.name:
-                exe_path = p
+        for candidate in (
+            search_dir / exe_name,
+            search_dir / f"{entry_stem}.dist" / exe_name,
+            search_dir / f"{output_name}.dist" / exe_name,
+            search_dir / f"{output_name}.build" / exe_name,
+        ):
+            if candidate.is_file():
+                exe_path = candidate
                 break
         if exe_path:
             break
 
     if not exe_path:
-        # Last resort: search current working directory
-        for p in Path.cwd().rglob("*.exe"):
-            if p.stem == output_name or output_name in p.name:
-                exe_path = p
-                break
+        # Last resort: bounded scan of the project for a similarly named exe
+        for p in _scan_files(
+            project_dir, lambda name: name.endswith(".exe") and output_name in name
+        ):
+            exe_path = p
+            break
+
+    return exe_path
+
+
+def copy_output(
+    project_dir: Path, config: dict, license_key: str, custom_output: str = None
+):
+    """Copy compiled output to Desktop or custom path."""
+    # Fix: Fallback to project_name if output_name is empty
+    output_name = config.get("output_name") or config.get("project_name") or "output"
+    exe_name = f"{output_name}.exe"
+
+    # run_pkg/run_nuitka record where the compiler was told to write
+    exe_path = config.get("_output_path")
+    if exe_path is None or not exe_path.is_file():
+        exe_path = _find_output(project_dir, config, output_name, exe_name)
 
     if exe_path and exe_path.exists():
         if custom_output:
@@ -1094,16 +2138,41 @@ def copy_output(
                 output_dir.mkdir(exist_ok=True)
             final_path = output_dir / exe_name
 
-        shutil.copy2(exe_path, final_path)
+        standalone = exe_path.parent.name.endswith(".dist")
+        if standalone:
+            # Standalone build: the exe needs the whole folder beside it, so
+            # it goes in <name>.dist rather than a folder the user may own
+            dist_dir = final_path.with_name(f"{final_path.stem}.dist")
+            try:
+                _replace_tree(exe_path.parent, dist_dir)
+            except FileExistsError:
+                color_print(
+                    f"❌ Error: {dist_dir} already exists and is not an "
+                    "lw-compiler build; choose a different --output.",
+                    Colors.RED,
+                )
+                return
+            final_path = dist_dir / exe_name
+            size = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _dirs, files in os.walk(dist_dir)
+                for name in files
+            )
+        else:
+            _copy_file(exe_path, final_path)
+            size = final_path.stat().st_size
 
-        size_mb = final_path.stat().st_size / (1024 * 1024)
+        size_mb = size / (1024 * 1024)
 
         print()
-        color_print(f"{'=' * 60}", Colors.GREEN)
-        color_print("  ✅ BUILD SUCCESSFUL!", Colors.GREEN)
-        color_print(f"{'=' * 60}", Colors.GREEN)
+        color_print(_SUCCESS_BANNER, Colors.GREEN)
         print(f"\n  Output: {Colors.CYAN}{final_path}{Colors.RESET}")
         print(f"  Size: {size_mb:.1f} MB")
+        if standalone:
+            print(
+                f"  Folder: ship all of {final_path.parent.name}/ with the .exe"
+                " (build with --onefile for a single file)"
+            )
         if license_key and license_key != "None":
             mode = "Runtime prompt" if license_key == "GENERIC_BUILD" else license_key
             print(f"  License: {mode}")
@@ -1119,98 +2188,137 @@ def copy_output(
 # =============================================================================
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="lw-compiler",
-        description="License Wrapper CLI - Compile apps with license protection",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  lw-compiler login                       Login with your account
-  lw-compiler projects                    List your projects
-  lw-compiler licenses PROJECT_ID         List licenses for a project
-  lw-compiler build PROJECT_ID -l KEY     Build project with license
-  lw-compiler build                       Interactive build mode
-        """,
-    )
+def _configure_cache(parser):
+    """Add the `cache` command's arguments."""
+    parser.add_argument("action", nargs="?", choices=["info", "clear"], default="info")
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    subparsers.add_parser("login", help="Login with your account")
-    subparsers.add_parser("logout", help="Logout and clear credentials")
-    subparsers.add_parser("projects", help="List your projects")
-    subparsers.add_parser("status", help="Show current status and environment")
+def _configure_licenses(parser):
+    """Add the `licenses` command's arguments."""
+    parser.add_argument("project_id", help="Project ID")
 
-    licenses_parser = subparsers.add_parser(
-        "licenses", help="List licenses for a project"
-    )
-    licenses_parser.add_argument("project_id", help="Project ID")
 
-    build_parser = subparsers.add_parser("build", help="Build a project locally")
-    build_parser.add_argument(
+def _configure_build(parser):
+    """Add the `build` command's arguments."""
+    parser.add_argument(
         "project_id",
         nargs="?",
         help="Project ID or path to entry file (for local build)",
     )
-    build_parser.add_argument("-l", "--license", help="License key to embed")
-    build_parser.add_argument(
+    parser.add_argument("-l", "--license", help="License key to embed")
+    parser.add_argument(
         "--generic",
         action="store_true",
         help="Build in generic mode (prompt for license at runtime)",
     )
-    build_parser.add_argument(
+    parser.add_argument(
         "--language", choices=["python", "nodejs"], help="Force language selection"
     )
-    build_parser.add_argument(
-        "--output", help="Output path for the executable (local build only)"
+    parser.add_argument(
+        "--output",
+        help="Output path for the executable (local build only); standalone "
+        "builds go in a <name>.dist folder beside it",
     )
-    build_parser.add_argument("--api-url", help="Override API URL (local build only)")
-    build_parser.add_argument(
+    parser.add_argument("--api-url", help="Override API URL (local build only)")
+    parser.add_argument(
         "--demo", action="store_true", help="Build in demo mode (local build only)"
     )
-    build_parser.add_argument(
+    parser.add_argument(
         "--demo-duration", type=int, help="Demo duration in minutes (local build only)"
     )
-    build_parser.add_argument(
+    parser.add_argument(
         "--open",
         action="store_true",
         help="Build without license protection (open build)",
     )
+    parser.add_argument(
+        "--onefile",
+        action="store_true",
+        help="Pack a Python build into a single self-extracting executable "
+        "instead of a folder",
+    )
+    parser.add_argument(
+        "--include-all",
+        action="store_true",
+        help="Force-include every project package, even ones no source imports",
+    )
+    parser.add_argument(
+        "--slim",
+        action="store_true",
+        help="Leave unittest, setuptools, pip etc. out of Python builds "
+        "unless the sources import them",
+    )
+    parser.add_argument(
+        "--force-rebuild",
+        "--clean",
+        action="store_true",
+        help="Re-download the bundle and compile from scratch, ignoring the cache",
+    )
 
-    args = parser.parse_args()
 
-    commands = {
-        "login": cmd_login,
-        "logout": cmd_logout,
-        "projects": cmd_projects,
-        "licenses": cmd_licenses,
-        "build": cmd_build,
-        "status": cmd_status,
-    }
+# Subcommand -> (help, handler, argument setup or None), in --help order
+_SUBCOMMANDS = {
+    "login": ("Login with your account", cmd_login, None),
+    "logout": ("Logout and clear credentials", cmd_logout, None),
+    "projects": ("List your projects", cmd_projects, None),
+    "status": ("Show current status and environment", cmd_status, None),
+    "cache": ("Show or clear the build cache", cmd_cache, _configure_cache),
+    "licenses": ("List licenses for a project", cmd_licenses, _configure_licenses),
+    "build": ("Build a project locally", cmd_build, _configure_build),
+}
 
-    if args.command in commands:
-        commands[args.command](args)
-    else:
-        # Show welcome banner with Quick Start guide
-        print(f"""
-{Colors.CYAN}╔════════════════════════════════════════════════════════════╗
-║  {Colors.BOLD}CodeVault CLI{Colors.CYAN} - Build license-protected executables    ║
-╚════════════════════════════════════════════════════════════╝{Colors.RESET}
 
-{Colors.GREEN}🚀 Quick Start:{Colors.RESET}
-  1. python lw_compiler.py login      {Colors.DIM}← Login first{Colors.RESET}
-  2. python lw_compiler.py build      {Colors.DIM}← Interactive build{Colors.RESET}
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 2:
+        # Bare invocation: show the banner without building the parser tree
+        print(_WELCOME_BANNER)
+        return
 
-{Colors.CYAN}📋 All Commands:{Colors.RESET}
-  login      Log in to your CodeVault account
-  logout     Log out and clear credentials
-  projects   List your projects
-  build      Build a project into an executable
-  status     Check login status and environment
+    wanted = sys.argv[1]
+    _help, func, configure = _SUBCOMMANDS.get(wanted, (None, None, None))
+    if func is not None and configure is None and len(sys.argv) == 2:
+        # An argument-less command on its own has nothing to parse
+        from types import SimpleNamespace
 
-{Colors.YELLOW}💡 Tip:{Colors.RESET} Run 'python lw_compiler.py status' to check your setup.
-""")
+        func(SimpleNamespace(command=wanted, func=func))
+        return
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="lw-compiler",
+        description="License Wrapper CLI - Compile apps with license protection",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  lw-compiler login                       Login with your account
+  lw-compiler projects                    List your projects
+  lw-compiler licenses PROJECT_ID         List licenses for a project
+  lw-compiler build PROJECT_ID -l KEY     Build project with license
+  lw-compiler build                       Interactive build mode
+        """,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only the requested subcommand's parser is built; --help or an unknown
+    # command gets the full tree
+    for name in [wanted] if wanted in _SUBCOMMANDS else _SUBCOMMANDS:
+        help_text, func, configure = _SUBCOMMANDS[name]
+        sub = subparsers.add_parser(name, help=help_text)
+        # Each subcommand names its handler; the heavy imports live inside them
+        sub.set_defaults(func=func)
+        if configure is not None:
+            configure(sub)
+
+    args = parser.parse_args()
+
+    if hasattr(args, "func"):
+        args.func(args)
+    else:
+        # Show welcome banner with Quick Start guide
+        print(_WELCOME_BANNER)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+// ============ LICENSE WRAPPER ============
+// Cache compiled bytecode between runs (Node 22.1+; skipped on older targets)
+try {
+    const _lw_module = require('module');
+    if (typeof _lw_module.enableCompileCache === 'function') {
+        const _lw_path = require('path');
+        _lw_module.enableCompileCache(_lw_path.join(
+            process.env.LOCALAPPDATA || require('os').tmpdir(),
+            _lw_path.basename(process.execPath, '.exe'),
+            'v8cache'
+        ));
+    }
+} catch (_) {}
+
+const crypto = require('crypto');
+const os = require('os');
+const https = require('https');
+const http = require('http');
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+
+function _lw_getExeDir() {
+    if (process.pkg) {
+        return path.dirname(process.execPath);
+    }
+    return __dirname;
+}
+
+function _lw_getLicenseKeyPath() {
+    return path.join(_lw_getExeDir(), 'license.key');
+}
+
+function _lw_promptForLicenseKey() {
+    return new Promise((resolve) => {
+        const rl = readline.createInterface({
+            input: process.stdin,
+            output: process.stdout
+        });
+        
+        console.log('\n' + '='.repeat(50));
+        console.log('  LICENSE KEY REQUIRED');
+        console.log('='.repeat(50));
+        
+        rl.question('Enter License Key: ', (answer) => {
+            rl.close();
+            const key = answer ? answer.trim() : null;
+            resolve(key);
+        });
+    });
+}
+
+async function _lw_loadOrPromptLicense() {
+    const licensePath = _lw_getLicenseKeyPath();
+    
+    if (fs.existsSync(licensePath)) {
+        try {
+            const key = fs.readFileSync(licensePath, 'utf-8').trim();
+            if (key) {
+                console.log(`[License Wrapper] Loaded license from ${licensePath}`);
+                return key;
+            }
+        } catch (e) {
+            console.log(`[License Wrapper] Warning: Could not read license file: ${e.message}`);
+        }
+    }
+    
+    console.log('[License Wrapper] No license key found. Please enter your license key.');
+    const licenseKey = await _lw_promptForLicenseKey();
+    
+    if (!licenseKey) {
+        console.log('\n❌ No license key provided. Exiting...');
+        process.exit(1);
+    }
+    
+    try {
+        fs.writeFileSync(licensePath, licenseKey, 'utf-8');
+        console.log(`[License Wrapper] License key saved to ${licensePath}`);
+    } catch (e) {
+        console.log(`[License Wrapper] Warning: Could not save license file: ${e.message}`);
+    }
+    
+    return licenseKey;
+}
+
+function _lw_deleteSavedLicense() {
+    try {
+        const licensePath = _lw_getLicenseKeyPath();
+        if (fs.existsSync(licensePath)) {
+            fs.unlinkSync(licensePath);
+            console.log('License file removed. Please try again with a valid key.');
+        }
+    } catch (e) {
+        // Ignore cleanup errors
+    }
+}
+
+async function _lw_validate() {
+    let LICENSE_KEY = "@@license_key";
+    const SERVER_URL = "@@server_url";
+    
+    if (LICENSE_KEY === "DEMO") {
+        console.log("[License Wrapper] Running in DEMO mode");
+        return true;
+    }
+    
+    if (LICENSE_KEY === "GENERIC_BUILD") {
+        LICENSE_KEY = await _lw_loadOrPromptLicense();
+    }
+    
+    return new Promise((resolve, reject) => {
+        const cpus = os.cpus();
+        const cpuModel = cpus && cpus.length > 0 ? cpus[0].model : 'generic';
+        const info = `${os.hostname()}|${os.platform()}|${os.arch()}|${os.totalmem()}|${cpuModel}`;
+        const hwid = crypto.createHash('sha256').update(info).digest('hex').substring(0, 32);
+        
+        try {
+            const urlObj = new URL(SERVER_URL + "/api/v1/license/validate");
+            const postData = JSON.stringify({
+                license_key: LICENSE_KEY,
+                hwid: hwid,
+                machine_name: os.hostname(),
+                timestamp: Math.floor(Date.now() / 1000),
+                nonce: crypto.randomBytes(16).toString('hex')
+            });
+            
+            const options = {
+                hostname: urlObj.hostname,
+                port: urlObj.port,
+                path: urlObj.pathname,
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Content-Length': Buffer.byteLength(postData)
+                }
+            };
+            
+            const lib = urlObj.protocol === 'http:' ? http : https;
+            const req = lib.request(options, (res) => {
+                let body = '';
+                res.on('data', (chunk) => body += chunk);
+                res.on('end', () => {
+                    if (res.statusCode === 200) {
+                        try {
+                            const result = JSON.parse(body);
+                            if (result.status === 'valid') {
+                                console.log("✅ License validated");
+                                resolve(true);
+                            } else {
+                                console.error(`❌ License error: ${result.message || 'Invalid'}`);
+                                if ("@@license_key" === "GENERIC_BUILD") {
+                                    _lw_deleteSavedLicense();
+                                }
+                                process.exit(1);
+                            }
+                        } catch (e) {
+                            console.error("❌ Failed to parse response");
+                            process.exit(1);
+                        }
+                    } else {
+                        console.error(`⚠️  Server error ${res.statusCode}`);
+                        if ("@@license_key" === "GENERIC_BUILD") {
+                            _lw_deleteSavedLicense();
+                        }
+                        process.exit(1);
+                    }
+                });
+            });
+            
+            req.on('error', (e) => {
+                console.error(`⚠️ Connection error: ${e.message}`);
+                console.log("[License Wrapper] Running in offline mode...");
+                resolve(true); 
+            });
+            
+            req.write(postData);
+            req.end();
+            
+        } catch (e) {
+            console.error(`❌ Validation error: ${e.message}`);
+            process.exit(1);
+        }
+    });
+}
+
+function _lw_pauseAndExit(code) {
+    if (process.platform === 'win32') {
+        const rl = readline.createInterface({
+            input: process.stdin,
+            output: process.stdout
+        });
+        rl.question('\nPress Enter to exit...', () => {
+            rl.close();
+            process.exit(code);
+        });
+    } else {
+        process.exit(code);
+    }
+}
+
+// Bootstrap
+_lw_validate().then(() => {
+    // Load original application
+    try {
+        console.log("[License Wrapper] Starting application...");
+        require('./@@target_file');
+    } catch (e) {
+        console.error('\n❌ Runtime Error:', e);
+        _lw_pauseAndExit(1);
+    }
+}).catch(e => {
+    console.error(e);
+    _lw_pauseAndExit(1);
+});
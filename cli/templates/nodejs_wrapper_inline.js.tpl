@@ -0,0 +1,252 @@
+// ============ LICENSE WRAPPER - DO NOT REMOVE ============
+// Cache compiled bytecode between runs (Node 22.1+; skipped on older targets)
+try {
+    const _lw_module = require('module');
+    if (typeof _lw_module.enableCompileCache === 'function') {
+        const _lw_path = require('path');
+        _lw_module.enableCompileCache(_lw_path.join(
+            process.env.LOCALAPPDATA || require('os').tmpdir(),
+            _lw_path.basename(process.execPath, '.exe'),
+            'v8cache'
+        ));
+    }
+} catch (_) {}
+
+// Global error handlers - MUST BE FIRST to catch any crash
+const _lw_readline_global = require('readline');
+
+function _lw_showErrorAndWait(type, error) {
+    console.error('\n' + '='.repeat(60));
+    console.error('  ❌ ' + type);
+    console.error('='.repeat(60));
+    console.error('\nError:', error.message || error);
+    if (error.stack) {
+        console.error('\nStack trace:');
+        console.error(error.stack);
+    }
+    console.error('\n' + '='.repeat(60));
+    console.error('Please take a screenshot and report this error.');
+    console.error('='.repeat(60));
+    
+    // Keep window open on Windows
+    if (process.platform === 'win32' && process.stdin.isTTY) {
+        const rl = _lw_readline_global.createInterface({
+            input: process.stdin,
+            output: process.stdout
+        });
+        rl.question('\nPress Enter to exit...', () => {
+            rl.close();
+            process.exit(1);
+        });
+    } else {
+        // Fallback: wait a bit so user can see error in terminal
+        setTimeout(() => process.exit(1), 5000);
+    }
+}
+
+// Catch uncaught exceptions (sync errors)
+process.on('uncaughtException', (error) => {
+    _lw_showErrorAndWait('UNCAUGHT EXCEPTION', error);
+});
+
+// Catch unhandled promise rejections (async errors)
+process.on('unhandledRejection', (reason, promise) => {
+    _lw_showErrorAndWait('UNHANDLED REJECTION', reason);
+});
+
+// ============ LICENSE WRAPPER CORE ============
+const _lw_crypto = require('crypto');
+const _lw_os = require('os');
+const _lw_https = require('https');
+const _lw_http = require('http');
+const _lw_fs = require('fs');
+const _lw_path = require('path');
+const _lw_readline = require('readline');
+
+function _lw_getExeDir() {
+    if (process.pkg) {
+        return _lw_path.dirname(process.execPath);
+    }
+    return __dirname;
+}
+
+function _lw_getLicenseKeyPath() {
+    return _lw_path.join(_lw_getExeDir(), 'license.key');
+}
+
+function _lw_promptForLicenseKey() {
+    return new Promise((resolve) => {
+        // Try PowerShell GUI dialog on Windows (supports copy-paste)
+        if (process.platform === 'win32') {
+            try {
+                const { execSync } = require('child_process');
+                const psCmd = 'powershell -Command "Add-Type -AssemblyName Microsoft.VisualBasic; [Microsoft.VisualBasic.Interaction]::InputBox(\'Please enter your License Key to activate this software:\', \'License Key Required\', \'\')"';
+                
+                const result = execSync(psCmd, { 
+                    encoding: 'utf-8',
+                    windowsHide: true
+                });
+                const key = result.trim();
+                if (key) {
+                    resolve(key);
+                    return;
+                }
+            } catch (e) {
+                console.log('[License Wrapper] GUI dialog failed, using console input');
+            }
+        }
+        
+        // Fallback to console input
+        const rl = _lw_readline.createInterface({
+            input: process.stdin,
+            output: process.stdout
+        });
+        
+        console.log('[License Wrapper] No license key found. Please enter your license key.');
+        rl.question('Enter License Key: ', (answer) => {
+            rl.close();
+            const key = answer ? answer.trim() : null;
+            resolve(key);
+        });
+    });
+}
+
+async function _lw_loadOrPromptLicense() {
+    const licensePath = _lw_getLicenseKeyPath();
+    
+    if (_lw_fs.existsSync(licensePath)) {
+        try {
+            const key = _lw_fs.readFileSync(licensePath, 'utf-8').trim();
+            if (key) {
+                console.log(`[License Wrapper] Loaded license from ${licensePath}`);
+                return key;
+            }
+        } catch (e) {
+            console.log(`[License Wrapper] Warning: Could not read license file: ${e.message}`);
+        }
+    }
+    
+    const licenseKey = await _lw_promptForLicenseKey();
+    
+    if (!licenseKey) {
+        console.log('\n❌ No license key provided. Exiting...');
+        process.exit(1);
+    }
+    
+    try {
+        _lw_fs.writeFileSync(licensePath, licenseKey, 'utf-8');
+        console.log(`[License Wrapper] License key saved to ${licensePath}`);
+    } catch (e) {
+        console.log(`[License Wrapper] Warning: Could not save license file: ${e.message}`);
+    }
+    
+    return licenseKey;
+}
+
+function _lw_deleteSavedLicense() {
+    try {
+        const licensePath = _lw_getLicenseKeyPath();
+        if (_lw_fs.existsSync(licensePath)) {
+            _lw_fs.unlinkSync(licensePath);
+            console.log('License file removed. Please try again with a valid key.');
+        }
+    } catch (e) {
+        // Ignore cleanup errors
+    }
+}
+
+async function _lw_validate() {
+    let LICENSE_KEY = "@@license_key";
+    const SERVER_URL = "@@server_url";
+    
+    if (LICENSE_KEY === "DEMO") {
+        console.log("[License Wrapper] Running in DEMO mode");
+        return true;
+    }
+    
+    if (LICENSE_KEY === "GENERIC_BUILD") {
+        LICENSE_KEY = await _lw_loadOrPromptLicense();
+    }
+    
+    return new Promise((resolve, reject) => {
+        const cpus = _lw_os.cpus();
+        const cpuModel = cpus && cpus.length > 0 ? cpus[0].model : 'generic';
+        const info = `${_lw_os.hostname()}|${_lw_os.platform()}|${_lw_os.arch()}|${_lw_os.totalmem()}|${cpuModel}`;
+        const hwid = _lw_crypto.createHash('sha256').update(info).digest('hex').substring(0, 32);
+        
+        try {
+            const urlObj = new URL(SERVER_URL + "/api/v1/license/validate");
+            const postData = JSON.stringify({
+                license_key: LICENSE_KEY,
+                hwid: hwid,
+                machine_name: _lw_os.hostname(),
+                timestamp: Math.floor(Date.now() / 1000),
+                nonce: _lw_crypto.randomBytes(16).toString('hex')
+            });
+            
+            const options = {
+                hostname: urlObj.hostname,
+                port: urlObj.port,
+                path: urlObj.pathname,
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Content-Length': Buffer.byteLength(postData)
+                }
+            };
+            
+            const lib = urlObj.protocol === 'http:' ? _lw_http : _lw_https;
+            const req = lib.request(options, (res) => {
+                let body = '';
+                res.on('data', (chunk) => body += chunk);
+                res.on('end', () => {
+                    if (res.statusCode === 200) {
+                        try {
+                            const result = JSON.parse(body);
+                            if (result.status === 'valid') {
+                                console.log("✅ License validated");
+                                resolve(true);
+                            } else {
+                                console.error(`❌ License error: ${result.message || 'Invalid'}`);
+                                if ("@@license_key" === "GENERIC_BUILD") {
+                                    _lw_deleteSavedLicense();
+                                }
+                                process.exit(1);
+                            }
+                        } catch (e) {
+                            console.error("❌ Failed to parse response");
+                            process.exit(1);
+                        }
+                    } else {
+                        console.error(`⚠️  Server error ${res.statusCode}`);
+                        if ("@@license_key" === "GENERIC_BUILD") {
+                            _lw_deleteSavedLicense();
+                        }
+                        process.exit(1);
+                    }
+                });
+            });
+            
+            req.on('error', (e) => {
+                console.error(`⚠️ Connection error: ${e.message}`);
+                console.log("[License Wrapper] Running in offline mode...");
+                resolve(true); 
+            });
+            
+            req.write(postData);
+            req.end();
+            
+        } catch (e) {
+            console.error(`❌ Validation error: ${e.message}`);
+            process.exit(1);
+        }
+    });
+}
+
+// Wrap everything in async IIFE to use await
+(async () => {
+    try {
+        await _lw_validate();
+        console.log("[License Wrapper] Starting application...");
+        // ============ END LICENSE WRAPPER - APP CODE BELOW ============
+
@@ -0,0 +1,187 @@
+# ============ LICENSE WRAPPER - DO NOT REMOVE ============
+import sys as _lw_sys
+import os as _lw_os
+import hashlib as _lw_hash
+import json as _lw_json
+import time as _lw_time
+import platform as _lw_platform
+
+def _lw_show_error(title, message, details=None):
+    """Show error with formatting and wait for user."""
+    print("\n" + "=" * 60)
+    print(f"  ❌ {title}")
+    print("=" * 60)
+    print(f"\n{message}")
+    if details:
+        print(f"\nDetails: {details}")
+    print("\n" + "=" * 60)
+    print("Please take a screenshot of this error and report it.")
+    print("=" * 60)
+    try:
+        input("\nPress Enter to exit...")
+    except Exception:
+        pass
+    _lw_sys.exit(1)
+
+def _lw_check_gui_available():
+    """Check if tkinter GUI is available."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+        root.destroy()
+        return True
+    except Exception as e:
+        print("[License Wrapper] GUI not available, using console mode")
+        print(f"[License Wrapper] Reason: {e}")
+        return False
+
+def _lw_get_hwid():
+    """Generate hardware ID."""
+    try:
+        info = f"{_lw_platform.node()}|{_lw_platform.machine()}|{_lw_platform.processor()}"
+        return _lw_hash.sha256(info.encode()).hexdigest()[:32]
+    except Exception as e:
+        print(f"[License Wrapper] Warning: Could not generate HWID: {e}")
+        return "unknown-hwid"
+
+def _lw_get_license_key_path():
+    """Get path to license.key file next to the executable."""
+    try:
+        if getattr(_lw_sys, 'frozen', False):
+            exe_dir = _lw_os.path.dirname(_lw_sys.executable)
+        else:
+            exe_dir = _lw_os.path.dirname(_lw_os.path.abspath(__file__))
+        return _lw_os.path.join(exe_dir, "license.key")
+    except Exception as e:
+        print(f"[License Wrapper] Warning: Could not get license path: {e}")
+        return "license.key"
+
+def _lw_prompt_for_license():
+    """Prompt user for license key using GUI or console fallback."""
+    try:
+        import tkinter as tk
+        from tkinter import simpledialog
+        
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes('-topmost', True)
+        
+        license_key = simpledialog.askstring(
+            "License Key Required",
+            "Please enter your License Key:",
+            parent=root
+        )
+        
+        root.destroy()
+        
+        if license_key and license_key.strip():
+            return license_key.strip()
+        return None
+        
+    except Exception as e:
+        print(f"[License Wrapper] GUI prompt failed: {e}")
+        try:
+            print("\\n" + "="*50)
+            print("  LICENSE KEY REQUIRED")
+            print("="*50)
+            license_key = input("Please enter your License Key: ").strip()
+            if license_key:
+                return license_key
+            return None
+        except Exception as e2:
+            print(f"[License Wrapper] Console prompt failed: {e2}")
+            return None
+
+def _lw_load_or_prompt_license():
+    """Load license from file or prompt user for it."""
+    license_path = _lw_get_license_key_path()
+    
+    if _lw_os.path.exists(license_path):
+        try:
+            with open(license_path, 'r', encoding='utf-8') as f:
+                license_key = f.read().strip()
+                if license_key:
+                    print(f"[License Wrapper] Loaded license from {license_path}")
+                    return license_key
+        except Exception as e:
+            print(f"[License Wrapper] Warning: Could not read license file: {e}")
+    
+    print("[License Wrapper] No license key found. Please enter your license key.")
+    license_key = _lw_prompt_for_license()
+    
+    if not license_key:
+        _lw_show_error("NO LICENSE KEY", "No license key was provided.", "The application requires a valid license key to run.")
+    
+    try:
+        with open(license_path, 'w', encoding='utf-8') as f:
+            f.write(license_key)
+        print(f"[License Wrapper] License key saved to {license_path}")
+    except Exception as e:
+        print(f"[License Wrapper] Warning: Could not save license file: {e}")
+    
+    return license_key
+
+def _lw_validate():
+    """Validate license with server."""
+    LICENSE_KEY = "@@license_key"
+    SERVER_URL = "@@server_url"
+    
+    # Check GUI availability at startup
+    _lw_check_gui_available()
+    
+    if LICENSE_KEY == "DEMO":
+        print("[License Wrapper] Running in DEMO mode")
+        return True
+    
+    if LICENSE_KEY == "GENERIC_BUILD":
+        LICENSE_KEY = _lw_load_or_prompt_license()
+    
+    try:
+        import urllib.request
+        import urllib.error
+        
+        hwid = _lw_get_hwid()
+        nonce = _lw_hash.sha256(str(_lw_time.time()).encode()).hexdigest()[:32]
+        
+        payload = _lw_json.dumps({
+            "license_key": LICENSE_KEY,
+            "hwid": hwid,
+            "machine_name": _lw_platform.node(),
+            "nonce": nonce,
+            "timestamp": int(_lw_time.time())
+        }).encode('utf-8')
+        
+        req = urllib.request.Request(
+            SERVER_URL + "/api/v1/license/validate",
+            data=payload,
+            headers={"Content-Type": "application/json"}
+        )
+        
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            result = _lw_json.loads(resp.read().decode('utf-8'))
+            
+            if result.get("status") == "valid":
+                print("✅ License validated successfully")
+                return True
+            else:
+                msg = result.get("message", "License invalid")
+                try:
+                    license_path = _lw_get_license_key_path()
+                    if _lw_os.path.exists(license_path):
+                        _lw_os.remove(license_path)
+                        print("License file removed. Please try again with a valid key.")
+                except Exception:
+                    pass
+                _lw_show_error("LICENSE INVALID", f"The license key was rejected by the server.", f"Server message: {msg}")
+                
+    except urllib.error.URLError as e:
+        print(f"⚠️ Could not reach license server: {e.reason}")
+        print("Running in offline mode...")
+        return True
+    except Exception as e:
+        _lw_show_error("LICENSE VALIDATION ERROR", f"An error occurred during license validation.", f"{type(e).__name__}: {e}")
+
+_lw_validate()
+# ============ END LICENSE WRAPPER ============
+
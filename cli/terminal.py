@@ -3,6 +3,7 @@ Terminal utilities for License Wrapper CLI.
 Provides colored output and console helpers.
 """
 
+import os
 import sys
 
 
@@ -20,6 +21,14 @@ class Colors:
     DIM = "\033[2m"
 
 
+def colors_supported() -> bool:
+    """Check whether stdout should receive ANSI color codes."""
+    if os.getenv("NO_COLOR"):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
 def enable_colors():
     """Enable ANSI colors on Windows."""
     if sys.platform == "win32":
@@ -32,25 +41,49 @@ def enable_colors():
             pass
 
 
-def color_print(msg, color=Colors.RESET):
-    """Print colored message with Unicode-safe encoding."""
-    enable_colors()
-    output = f"{color}{msg}{Colors.RESET}"
+def _safe_print(output: str):
+    """Print, replacing characters the console encoding cannot show."""
+    # One write() call, without print()'s argument handling
     try:
-        print(output)
+        sys.stdout.write(output + "\n")
     except UnicodeEncodeError:
         # Fallback for Windows consoles that don't support Unicode
         safe_output = output.encode(
             sys.stdout.encoding or "utf-8", errors="replace"
         ).decode(sys.stdout.encoding or "utf-8", errors="replace")
-        print(safe_output)
+        sys.stdout.write(safe_output + "\n")
+
+
+def _ansi_color_print(msg, color=Colors.RESET):
+    """Print colored message with Unicode-safe encoding."""
+    _safe_print(f"{color}{msg}{Colors.RESET}")
+
+
+def _plain_print(msg, color=None):
+    """Print message without color codes (output is not a terminal)."""
+    _safe_print(f"{msg}")
+
+
+# Decide on colors once at import: enable the Windows console mode and use
+# the ANSI printer for a terminal, or blank every code and print plain text
+# so redirected output stays clean. color_print itself never branches.
+if colors_supported():
+    enable_colors()
+    color_print = _ansi_color_print
+else:
+    for _name in [n for n in vars(Colors) if n.isupper()]:
+        setattr(Colors, _name, "")
+    color_print = _plain_print
+
+
+_RULE = "=" * 60
+_HEADER_OPEN = f"\n{Colors.CYAN}{_RULE}\n  "
+_HEADER_CLOSE = f"\n{_RULE}{Colors.RESET}\n"
 
 
 def print_header(title: str):
     """Print a styled header."""
-    print(f"\n{Colors.CYAN}{'=' * 60}")
-    print(f"  {title}")
-    print(f"{'=' * 60}{Colors.RESET}\n")
+    print(_HEADER_OPEN + title + _HEADER_CLOSE)
 
 
 def print_success(msg: str):
@@ -19,15 +19,23 @@ from typing import Optional, List
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 import secrets
 import logging
 import re
 
+# Optional: zstd transfer encoding for CLI build bundles
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 
 # =============================================================================
 # Logging Filter to reduce /status endpoint spam
@@ -64,6 +72,8 @@ from utils import (
     safe_join,
     validate_project_id,
     SecurityError,
+    etag_json_response,
+    etag_matches,
 )
 
 # Import storage and email services
@@ -224,18 +234,19 @@ async def cleanup_compile_cache():
 
 
 @app.get("/api/v1/projects")
-async def list_projects(user: dict = Depends(get_current_user)):
+async def list_projects(request: Request, user: dict = Depends(get_current_user)):
     conn = await get_db()
     try:
         rows = await conn.fetch(
             """
             SELECT p.id, p.name, p.description, p.created_at, p.language,
+                   COALESCE((p.settings->>'is_multi_folder')::boolean, FALSE) as is_multi_folder,
                    (SELECT COUNT(*) FROM licenses l WHERE l.project_id = p.id) as license_count
             FROM projects p WHERE p.user_id = $1 ORDER BY p.created_at DESC
         """,
             user["id"],
         )
-        return [
+        projects = [
             {
                 "id": r["id"],
                 "name": r["name"],
@@ -243,10 +254,12 @@ async def list_projects(user: dict = Depends(get_current_user)):
                 "language": r.get("language", "python"),
                 "created_at": r["created_at"].isoformat(),
                 "license_count": r["license_count"],
+                "is_multi_folder": r["is_multi_folder"],
                 "local_path": str(LOCAL_UPLOAD_DIR / r["id"]),
             }
             for r in rows
         ]
+        return etag_json_response(request, projects)
     finally:
         await release_db(conn)
 
@@ -1078,11 +1091,12 @@ async def get_cli_version():
 
 @app.get("/api/v1/projects/{project_id}/compile-config")
 async def get_compile_config(
+    request: Request,
     project_id: str,
     license_key: Optional[str] = None,
     user: dict = Depends(get_current_user),
 ):
-    """Get compilation configuration for the CLI tool."""
+    """Get compilation configuration for the CLI tool (ETag-revalidated)."""
     conn = await get_db()
     try:
         project = await conn.fetchrow(
@@ -1122,7 +1136,7 @@ async def get_compile_config(
 
         server_url = os.getenv("PUBLIC_API_URL", "http://localhost:8000")
 
-        return {
+        config = {
             "project_id": project_id,
             "project_name": project["name"],
             "entry_file": entry_file,
@@ -1137,12 +1151,14 @@ async def get_compile_config(
             "folders": folders,
             "language": project.get("language", "python"),
         }
+        return etag_json_response(request, config)
     finally:
         await release_db(conn)
 
 
 @app.get("/api/v1/projects/{project_id}/build-bundle")
 async def get_build_bundle(
+    request: Request,
     project_id: str,
     license_id: Optional[str] = None,
     user: dict = Depends(get_current_user),
@@ -1154,7 +1170,13 @@ async def get_build_bundle(
     - source/ folder (all project files)
     - config.json (entry_file, output_name, license_key, api_url, options)
     - assets/ folder (icon if provided)
+
+    The response carries an ETag over the bundle inputs; a matching
+    If-None-Match gets 304 Not Modified without the ZIP being built.
+    Clients that accept zstd get an uncompressed ZIP sent with
+    Content-Encoding: zstd, so they never have to inflate DEFLATE members.
     """
+    import hashlib
     import tempfile
 
     conn = await get_db()
@@ -1233,14 +1255,40 @@ async def get_build_bundle(
             "exclude_modules": settings.get("exclude_modules", []),
         }
 
+        # Fingerprint config + file listing (path, size, mtime) so clients
+        # holding this exact bundle can skip the download
+        assets_dir = safe_join(project_dir, "assets")
+        fingerprint = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        )
+        for prefix, root in (("source", source_dir), ("assets", assets_dir)):
+            if not root.exists():
+                continue
+            for file_path in sorted(root.rglob("*")):
+                if file_path.is_file():
+                    st = file_path.stat()
+                    fingerprint.update(
+                        f"{prefix}/{file_path.relative_to(root)}\0"
+                        f"{st.st_size}\0{st.st_mtime_ns}\n".encode()
+                    )
+        etag = f'"{fingerprint.hexdigest()[:32]}"'
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        use_zstd = HAS_ZSTD and "zstd" in request.headers.get("accept-encoding", "")
+
         # Create temp ZIP file
         with tempfile.NamedTemporaryFile(
             mode="wb", suffix=".zip", delete=False
         ) as tmp_file:
             zip_path = tmp_file.name
+        zst_path = zip_path + ".zst"
 
         try:
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            # With zstd the whole archive is compressed once on the wire, so
+            # the members are stored rather than deflated individually
+            compression = zipfile.ZIP_STORED if use_zstd else zipfile.ZIP_DEFLATED
+            with zipfile.ZipFile(zip_path, "w", compression) as zf:
                 # Add config.json
                 zf.writestr("config.json", json.dumps(config, indent=2))
 
@@ -1251,31 +1299,42 @@ async def get_build_bundle(
                         zf.write(file_path, arcname)
 
                 # Add assets folder if exists (icon, etc.)
-                assets_dir = safe_join(project_dir, "assets")
                 if assets_dir.exists():
                     for file_path in assets_dir.rglob("*"):
                         if file_path.is_file():
                             arcname = f"assets/{file_path.relative_to(assets_dir)}"
                             zf.write(file_path, arcname)
 
+            headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+            send_path = zip_path
+            if use_zstd:
+                cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+                with open(zip_path, "rb") as src, open(zst_path, "wb") as dst:
+                    cctx.copy_stream(src, dst)
+                headers["Content-Encoding"] = "zstd"
+                send_path = zst_path
+
             # Return the ZIP file with cleanup task
             filename = f"{project['name'].replace(' ', '_')}_bundle.zip"
 
             def cleanup_temp_file():
-                """Delete temp file after response is sent."""
-                if os.path.exists(zip_path):
-                    os.unlink(zip_path)
+                """Delete temp files after response is sent."""
+                for path in (zip_path, zst_path):
+                    if os.path.exists(path):
+                        os.unlink(path)
 
             return FileResponse(
-                path=zip_path,
+                path=send_path,
                 filename=filename,
                 media_type="application/zip",
+                headers=headers,
                 background=BackgroundTask(cleanup_temp_file),
             )
         except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(zip_path):
-                os.unlink(zip_path)
+            # Clean up temp files on error
+            for path in (zip_path, zst_path):
+                if os.path.exists(path):
+                    os.unlink(path)
             raise HTTPException(
                 status_code=500, detail=f"Failed to create build bundle: {str(e)}"
             )
@@ -23,6 +23,7 @@ from utils import (
     generate_license_key,
     create_validation_response,
     get_user_tier_limits,
+    etag_json_response,
 )
 from database import get_db, release_db
 from email_service import notify_license_created
@@ -295,7 +296,9 @@ async def validate_license(request: Request, data: LicenseValidationRequest):
 
 @router.get("/licenses")
 async def list_licenses(
-    user: dict = Depends(get_current_user), project_id: Optional[str] = None
+    request: Request,
+    user: dict = Depends(get_current_user),
+    project_id: Optional[str] = None,
 ):
     conn = await get_db()
     try:
@@ -341,7 +344,7 @@ async def list_licenses(
                     "active_machines": r["active_machines"],
                 }
             )
-        return result
+        return etag_json_response(request, result)
     finally:
         await release_db(conn)
 
@@ -3,6 +3,7 @@ Utility functions for CodeVault API.
 """
 
 import re
+import json
 import time
 import secrets
 import hashlib
@@ -13,7 +14,8 @@ from typing import Optional, List, Union
 
 import jwt
 import bcrypt
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request
+from fastapi.responses import Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from config import SECRET_KEY, JWT_SECRET, JWT_ALGORITHM, JWT_EXPIRATION_HOURS
@@ -328,6 +330,35 @@ def create_validation_response(
     )
 
 
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match names `etag`.
+
+    Accepts a comma-separated list, weak (W/) validators and `*`, as
+    conditional GETs compare ETags weakly.
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def etag_json_response(request: Request, data) -> Response:
+    """
+    Serialize `data` as JSON with an ETag for conditional GETs.
+
+    Returns 304 Not Modified (no body) when the request's If-None-Match
+    already names the current ETag, so clients that cache list responses
+    only download them when they change.
+    """
+    body = json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 async def get_user_tier_limits(user_id: str, conn) -> dict:
     """Get subscription tier limits for a user.
 
@@ -71,7 +71,8 @@ pub fn get_backend_port() -> Option<u16> {
     let port_file = get_port_file();
     if port_file.exists() {
         if let Ok(content) = fs::read_to_string(&port_file) {
-            return content.trim().parse().ok();
+            // Backend writes "pid:port"; older versions wrote just the port
+            return content.trim().rsplit(':').next()?.parse().ok();
         }
     }
     None
@@ -0,0 +1,111 @@
+"""
+Tests for the CLI build workspace cache (cli/build_cache.py).
+"""
+
+import io
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import build_cache  # noqa: E402
+
+
+def _bundle(files: dict) -> zipfile.ZipFile:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return zipfile.ZipFile(buf)
+
+
+def test_source_hash_ignores_per_request_config():
+    a = _bundle({"config.json": '{"license_key": "A"}', "source/main.py": "x = 1"})
+    b = _bundle({"config.json": '{"license_key": "B"}', "source/main.py": "x = 1"})
+    assert build_cache.source_hash(a) == build_cache.source_hash(b)
+
+
+def test_source_hash_tracks_source_changes():
+    a = _bundle({"source/main.py": "x = 1"})
+    b = _bundle({"source/main.py": "x = 2"})
+    assert build_cache.source_hash(a) != build_cache.source_hash(b)
+
+
+def test_prune_keeps_most_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, "CACHE_DIR", tmp_path)
+    for i in range(4):
+        ws = tmp_path / f"ws{i}"
+        ws.mkdir()
+        build_cache.write_meta(ws, {"n": i})
+        os.utime(ws / build_cache.META_FILE, (i, i))
+
+    build_cache.prune(keep=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ws2", "ws3"]
+
+
+def test_remembered_bundle_is_found_until_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(build_cache, "BUNDLE_INDEX", tmp_path / "bundles.json")
+    ws = tmp_path / "ws"
+    ws.mkdir()
+
+    assert build_cache.cached_bundle("p1") is None
+    build_cache.remember_bundle("p1", '"etag"', ws, b"zipdata")
+    etag, path = build_cache.cached_bundle("p1")
+    assert etag == '"etag"' and path.read_bytes() == b"zipdata"
+
+    build_cache.prune(keep=0)
+    assert build_cache.cached_bundle("p1") is None
+
+
+def test_workspace_lock_is_exclusive(tmp_path):
+    ws = tmp_path / "ws"
+    lock = build_cache.try_lock(ws)
+    assert lock is not None
+    assert build_cache.try_lock(ws) is None
+    build_cache.release(lock)
+    again = build_cache.try_lock(ws)
+    assert again is not None
+    build_cache.release(again)
+
+
+def test_prune_skips_locked_workspaces(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, "CACHE_DIR", tmp_path)
+    for i in range(3):
+        ws = tmp_path / f"ws{i}"
+        ws.mkdir()
+        build_cache.write_meta(ws, {"n": i})
+        os.utime(ws / build_cache.META_FILE, (i, i))
+
+    lock = build_cache.try_lock(tmp_path / "ws0")
+    try:
+        build_cache.prune(keep=1)
+    finally:
+        build_cache.release(lock)
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["ws0", "ws2"]
+    assert not (tmp_path / "ws1.lock").exists()
+
+
+def test_clear_keeps_locked_workspaces(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(build_cache, "CACHE_DIR", cache)
+    monkeypatch.setattr(build_cache, "BUNDLE_INDEX", cache / "bundles.json")
+    for name in ("busy", "idle"):
+        (cache / name).mkdir(parents=True)
+        (cache / name / "data").write_bytes(b"x" * 100)
+    (cache / "bundles.json").write_text("{}")
+
+    lock = build_cache.try_lock(cache / "busy")
+    try:
+        freed, in_use = build_cache.clear()
+        assert in_use == ["busy"]
+        assert freed >= 100
+        assert (cache / "busy" / "data").exists()
+        assert not (cache / "idle").exists()
+        assert not (cache / "bundles.json").exists()
+    finally:
+        build_cache.release(lock)
+
+    freed, in_use = build_cache.clear()
+    assert in_use == [] and not cache.exists()
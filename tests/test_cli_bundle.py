@@ -0,0 +1,167 @@
+"""
+Tests for bundle extraction in the CLI compiler (cli/lw_compiler.py).
+"""
+
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import lw_compiler  # noqa: E402
+
+
+def _bundle(names) -> zipfile.ZipFile:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name in names:
+            zf.writestr(name, "x")
+    return zipfile.ZipFile(buf)
+
+
+def test_bundle_members_skips_build_junk():
+    zf = _bundle(
+        [
+            "config.json",
+            "source/main.py",
+            "source/__pycache__/main.cpython-311.pyc",
+            "source/util.pyc",
+            "source/.git/HEAD",
+            "source/.DS_Store",
+            "source/node_modules/axios/index.js",
+        ]
+    )
+    names = [m.filename for m in lw_compiler.bundle_members(zf)]
+    assert names == ["config.json", "source/main.py"]
+
+
+@pytest.mark.parametrize("name", ["../evil.py", "/etc/evil", "source/../../evil"])
+def test_bundle_members_rejects_unsafe_paths(name):
+    zf = _bundle(["source/main.py", name])
+    with pytest.raises(ValueError):
+        lw_compiler.bundle_members(zf)
+
+
+def test_index_files_counts_sources_and_skips_build_dirs(tmp_path):
+    for rel in (
+        "app.py",
+        "pkg/__init__.py",
+        "pkg/sub/app.py",
+        "app.build/module.c",
+        "node_modules/x/index.js",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    index, count = lw_compiler.index_files(tmp_path)
+    assert count == 3
+    assert index["app.py"] == tmp_path / "app.py"
+    assert "module.c" not in index
+    assert (
+        lw_compiler.find_entry_file(tmp_path / "pkg", "app.py", index)
+        == index["app.py"]
+    )
+
+
+def test_imported_modules_resolves_from_and_relative_imports(tmp_path):
+    files = {
+        "main.py": "import os\nfrom backend.api import routes\n",
+        "backend/api/__init__.py": "from . import views\nfrom ..db import models\n",
+        "broken.py": "import (\n",
+    }
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    modules = lw_compiler.imported_modules(tmp_path)
+    assert {"os", "backend.api", "backend.api.routes"} <= modules
+    assert {"backend.api.views", "backend.db", "backend.db.models"} <= modules
+
+
+def test_link_or_copy_links_sources_but_copies_edited_files(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "main.py").write_text("print(1)\n")
+    (src / "package.json").write_text("{}")
+    dst = tmp_path / "dst"
+    dst.mkdir()
+
+    lw_compiler._link_or_copy(str(src / "main.py"), str(dst / "main.py"))
+    lw_compiler._link_or_copy(str(src / "package.json"), str(dst / "package.json"))
+    assert os.path.samefile(src / "main.py", dst / "main.py")
+    assert not os.path.samefile(src / "package.json", dst / "package.json")
+
+    lw_compiler.inject_license_wrapper(dst, {"entry_file": "main.py"})
+    assert (src / "main.py").read_text() == "print(1)\n"
+    assert (dst / "main.py").read_text().endswith("print(1)\n")
+
+
+def test_inject_license_wrapper_wraps_extra_entries_once(tmp_path):
+    (tmp_path / "main.py").write_text("print('main')\n")
+    (tmp_path / "worker.py").write_text("print('worker')\n")
+    config = {"entry_file": "main.py", "license_key": "LIC"}
+
+    entry = lw_compiler.inject_license_wrapper(
+        tmp_path, config, extra_entries=("worker.py", "worker.py", "missing.py")
+    )
+    assert entry == tmp_path / "main.py"
+    main_text = entry.read_text()
+    worker_text = (tmp_path / "worker.py").read_text()
+    assert main_text.endswith("print('main')\n")
+    assert worker_text.endswith("print('worker')\n")
+    wrapper = main_text[: -len("print('main')\n")]
+    assert wrapper and worker_text == wrapper + "print('worker')\n"
+
+
+def test_copy_file_copies_data_and_metadata(tmp_path):
+    src = tmp_path / "app.exe"
+    src.write_bytes(os.urandom(1 << 16))
+    os.chmod(src, 0o755)
+    out = tmp_path / "out"
+    out.mkdir()
+
+    dst = lw_compiler._copy_file(src, out)
+    assert dst == str(out / "app.exe")
+    assert (out / "app.exe").read_bytes() == src.read_bytes()
+    assert os.stat(dst).st_mode == os.stat(src).st_mode
+    assert os.stat(dst).st_mtime == os.stat(src).st_mtime
+
+
+def test_replace_tree_drops_files_from_an_earlier_build(tmp_path):
+    src = tmp_path / "main.dist"
+    src.mkdir()
+    (src / "app.exe").write_text("old")
+    (src / "stale.pyd").write_text("old")
+    dst = tmp_path / "app.dist"
+    lw_compiler._replace_tree(src, dst)
+
+    (src / "stale.pyd").unlink()
+    (src / "app.exe").write_text("new")
+    lw_compiler._replace_tree(src, dst)
+    assert sorted(os.listdir(dst)) == [lw_compiler._OUTPUT_MARKER, "app.exe"]
+    assert (dst / "app.exe").read_text() == "new"
+    assert sorted(os.listdir(tmp_path)) == ["app.dist", "main.dist"]
+
+
+def test_copy_output_never_replaces_an_unrelated_folder(tmp_path):
+    dist = tmp_path / "build" / "main.dist"
+    dist.mkdir(parents=True)
+    (dist / "app.exe").write_text("exe")
+    mine = tmp_path / "out" / "app.dist"
+    mine.mkdir(parents=True)
+    (mine / "notes.txt").write_text("keep me")
+    config = {"output_name": "app", "_output_path": dist / "app.exe"}
+
+    lw_compiler.copy_output(tmp_path, config, None, str(tmp_path / "out" / "app.exe"))
+    assert os.listdir(mine) == ["notes.txt"]
+
+    # A path without a suffix names a folder of its own, never the parent
+    out = tmp_path / "out"
+    lw_compiler.copy_output(tmp_path, config, None, str(out))
+    assert (tmp_path / "out.dist" / "app.exe").read_text() == "exe"
+    assert (mine / "notes.txt").read_text() == "keep me"
@@ -0,0 +1,115 @@
+"""
+Tests for the CLI config cache (cli/cli_config.py).
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import cli_config  # noqa: E402
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point the CLI config at a temporary file."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(cli_config, "CONFIG_FILE", path)
+    cli_config.invalidate_config_cache()
+    yield path
+    cli_config.invalidate_config_cache()
+
+
+def test_missing_config_returns_empty(config_file):
+    assert cli_config.load_config() == {}
+    assert cli_config.get_headers() is None
+    assert not cli_config.is_logged_in()
+
+
+def test_save_then_load_sees_new_values(config_file):
+    cli_config.save_config({"api_key": "abc"})
+    assert cli_config.load_config() == {"api_key": "abc"}
+    assert cli_config.get_headers() == {"Authorization": "Bearer abc"}
+
+    cli_config.save_config({"api_key": "xyz"})
+    assert cli_config.get_headers() == {"Authorization": "Bearer xyz"}
+
+
+def test_external_edit_invalidates_cache(config_file):
+    cli_config.save_config({"api_key": "abc"})
+    cli_config.load_config()
+
+    config_file.write_text(json.dumps({"api_key": "edited-key"}))
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert cli_config.load_config()["api_key"] == "edited-key"
+
+
+def test_caller_mutation_does_not_leak_into_cache(config_file):
+    cli_config.save_config({"api_key": "abc"})
+    config = cli_config.load_config()
+    config["api_key"] = "changed"
+    assert cli_config.load_config()["api_key"] == "abc"
+
+
+def test_clear_config_logs_out(config_file):
+    cli_config.save_config({"api_key": "abc"})
+    cli_config.clear_config()
+    assert not config_file.exists()
+    assert not cli_config.is_logged_in()
+
+
+def test_forget_token_keeps_account_details(config_file):
+    cli_config.save_config({"api_key": "abc", "email": "a@b.c"})
+    cli_config.forget_token()
+    assert cli_config.load_config() == {"email": "a@b.c"}
+    assert not cli_config.is_logged_in()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_save_config_is_private(config_file):
+    cli_config.save_config({"api_key": "abc"})
+    assert config_file.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in config_file.parent.iterdir()] == ["config.json"]
+
+
+def test_get_auth_matches_accessors(config_file):
+    assert cli_config.get_auth() == (False, None)
+    cli_config.save_config({"api_key": "abc"})
+    assert cli_config.get_auth() == (True, {"Authorization": "Bearer abc"})
+
+
+def test_save_config_is_write_through(config_file, monkeypatch):
+    cli_config.save_config({"api_key": "abc"})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("config re-read from disk")
+
+    monkeypatch.setattr(cli_config, "_loads", fail)
+    assert cli_config.load_config() == {"api_key": "abc"}
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"e30.{payload.decode()}.sig"
+
+
+def test_expired_token_counts_as_logged_out(config_file):
+    cli_config.save_config({"api_key": _jwt({"exp": time.time() - 60})})
+    assert cli_config.get_auth() == (False, None)
+    assert not cli_config.is_logged_in()
+
+
+def test_valid_and_opaque_tokens_are_accepted(config_file):
+    token = _jwt({"exp": time.time() + 3600})
+    cli_config.save_config({"api_key": token})
+    assert cli_config.get_headers() == {"Authorization": f"Bearer {token}"}
+
+    assert not cli_config.token_expired("not-a-jwt")
+    assert not cli_config.token_expired("a.!!!.c")
@@ -0,0 +1,38 @@
+"""
+Tests for the CLI toolchain probe cache (cli/env_cache.py).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import env_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "env.json"
+    monkeypatch.setattr(env_cache, "ENV_CACHE_FILE", path)
+    return path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as node")
+def test_node_version_is_probed_once(tmp_path, monkeypatch):
+    calls = tmp_path / "calls"
+    node = tmp_path / "bin" / "node"
+    node.parent.mkdir()
+    node.write_text(f"#!/bin/sh\necho x >> {calls}\necho v20.1.0\n")
+    node.chmod(0o755)
+    monkeypatch.setenv("PATH", str(node.parent))
+
+    assert env_cache.get_node_version() == "v20.1.0"
+    assert env_cache.get_node_version() == "v20.1.0"
+    assert calls.read_text().count("x") == 1
+
+
+def test_node_version_without_node(monkeypatch, tmp_path):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert env_cache.get_node_version() is None
@@ -0,0 +1,48 @@
+"""
+Tests for the CLI ETag response cache (cli/http_cache.py).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import http_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "http_cache.json"
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_FILE", path)
+    return path
+
+
+def test_store_and_lookup_round_trip():
+    assert http_cache.lookup("/projects") is None
+    http_cache.store("/projects", '"abc"', "[]")
+    assert http_cache.lookup("/projects") == {"etag": '"abc"', "body": "[]"}
+
+
+def test_store_evicts_oldest_entries(monkeypatch):
+    monkeypatch.setattr(http_cache, "MAX_ENTRIES", 2)
+    for key in ("a", "b", "c"):
+        http_cache.store(key, '"e"', "[]")
+    assert http_cache.lookup("a") is None
+    assert http_cache.lookup("c") is not None
+
+
+def test_clear_and_corrupt_file(cache_file):
+    http_cache.store("a", '"e"', "[]")
+    http_cache.clear()
+    assert not cache_file.exists()
+    cache_file.write_text("{not json")
+    assert http_cache.lookup("a") is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_store_writes_private_file(cache_file):
+    http_cache.store("/licenses", '"e"', "[]")
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
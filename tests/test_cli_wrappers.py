@@ -0,0 +1,32 @@
+"""
+Tests for the license wrapper templates (cli/wrappers.py).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "cli"))
+
+import wrappers  # noqa: E402
+
+
+def test_python_wrapper_substitutes_placeholders():
+    code = wrappers.get_python_wrapper("LIC-1234", "https://example.com")
+    assert 'LICENSE_KEY = "LIC-1234"' in code
+    assert 'SERVER_URL = "https://example.com"' in code
+    assert "@@" not in code
+    compile(code, "<wrapper>", "exec")
+
+
+def test_nodejs_inline_wrapper_keeps_template_literals():
+    prefix, suffix = wrappers.get_nodejs_wrapper_inline("GENERIC_BUILD", "http://x")
+    assert 'let LICENSE_KEY = "GENERIC_BUILD";' in prefix
+    assert "${licensePath}" in prefix
+    assert "@@" not in prefix
+    assert "enableCompileCache" in prefix
+    assert suffix.rstrip().endswith("});")
+
+
+def test_nodejs_legacy_wrapper_escapes_target_file():
+    code = wrappers.get_nodejs_wrapper("K", "http://x", "it's.js")
+    assert "require('./it\\'s.js');" in code